@@ -14,8 +14,12 @@ if str(repo_root) not in sys.path:
     sys.path.insert(0, str(repo_root))
 
 
-# Configure pytest-asyncio to use session scope by default
+# pytest-asyncio mode and loop scopes are set in pytest.ini
 def pytest_configure(config):
-    """Configure pytest-asyncio to use session scope."""
-    config.option.asyncio_mode = "strict"
-    config.option.asyncio_default_fixture_loop_scope = "session"
+    """Register the custom markers used across the test suite."""
+    config.addinivalue_line(
+        "markers", "integration: slower tests spanning several components"
+    )
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run tests of a group on the same xdist worker"
+    )
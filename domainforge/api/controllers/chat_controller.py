@@ -299,7 +299,7 @@ async def _process_message_for_domain_model(
                         if len(parts) > 1 and parts[1].strip():
                             # Simplified property extraction
                             properties = [p.strip() for p in parts[1].split(",")]
-                            if entity_name not in session.domain_entities:
+                            if not session.has_entity(entity_name):
                                 session.add_entity(entity_name, properties)
         except Exception:
             # Fail silently in background task
@@ -215,7 +215,7 @@ class AIClient:
             response.raise_for_status()
 
             # Parse the response
-            data = await response.json()
+            data = response.json()
             ai_response = AIResponse(**data)
 
             # Extract the content from the first choice
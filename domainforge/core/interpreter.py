@@ -5,8 +5,10 @@ domain models that can be used by code generators.
 """
 
 import os
+import sys
 from pathlib import Path
-from typing import Dict, Union, List, Any
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, Tuple, Union
 
 from .models import DomainModel
 from .parser import DomainForgeParser
@@ -214,13 +216,119 @@ class DomainForgeInterpreter:
                         )
 
 
+class _DomainModelStore:
+    """Column-oriented storage shared by the elicitation session and builder.
+
+    Entity properties live in one flat list; entity i owns the slice starting
+    at ``_entity_offsets[i]`` and ending at the next offset. Relationships are
+    kept as parallel source/target/type columns.
+    """
+
+    def __init__(self) -> None:
+        self._entity_names: List[str] = []
+        self._entity_index: Dict[str, int] = {}
+        self._entity_offsets: List[int] = []
+        self._properties: List[str] = []
+        self._sources: List[str] = []
+        self._targets: List[str] = []
+        self._types: List[str] = []
+
+    def has_entity(self, name: str) -> bool:
+        """Return whether an entity with this name has been added."""
+        return name in self._entity_index
+
+    def add_entity(self, name: str, properties: List[str]) -> None:
+        """Add an entity, replacing the properties of an existing one."""
+        index = self._entity_index.get(name)
+        if index is None:
+            self._entity_index[name] = len(self._entity_names)
+            self._entity_names.append(name)
+            self._entity_offsets.append(len(self._properties))
+            self._properties.extend(properties)
+            return
+
+        # Replace the row in place and shift the offsets of later entities
+        start, end = self._bounds(index)
+        self._properties[start:end] = properties
+        delta = len(properties) - (end - start)
+        if delta:
+            for later in range(index + 1, len(self._entity_offsets)):
+                self._entity_offsets[later] += delta
+
+    def _bounds(self, index: int) -> Tuple[int, int]:
+        """Return the slice of ``_properties`` owned by entity ``index``."""
+        start = self._entity_offsets[index]
+        if index + 1 < len(self._entity_offsets):
+            return start, self._entity_offsets[index + 1]
+        return start, len(self._properties)
+
+    def add_relationship(
+        self, source: str, target: str, relationship_type: str
+    ) -> None:
+        """Append a relationship between entities."""
+        # Entity names and relationship symbols repeat heavily; share them
+        self._sources.append(sys.intern(source))
+        self._targets.append(sys.intern(target))
+        self._types.append(sys.intern(relationship_type))
+
+    def _entity_rows(self) -> Iterator[Tuple[str, List[str]]]:
+        """Yield each entity name with a copy of its properties."""
+        ends = self._entity_offsets[1:] + [len(self._properties)]
+        for name, start, end in zip(self._entity_names, self._entity_offsets, ends):
+            yield name, self._properties[start:end]
+
+    def _relationship_rows(self) -> Iterator[Dict[str, str]]:
+        """Yield each relationship as a ``{"source", "target", "type"}`` dict."""
+        for source, target, relationship_type in zip(
+            self._sources, self._targets, self._types
+        ):
+            yield {"source": source, "target": target, "type": relationship_type}
+
+    @property
+    def entities(self) -> Mapping[str, Tuple[str, ...]]:
+        """Read-only view of entity name to property strings.
+
+        The view is rebuilt from the columns on every access; use
+        ``has_entity`` for membership checks and ``snapshot`` to read the
+        whole model once. A later ``add_entity`` call for the same name
+        replaces its properties.
+        """
+        return MappingProxyType(
+            {name: tuple(properties) for name, properties in self._entity_rows()}
+        )
+
+    @entities.setter
+    def entities(self, entities: Dict[str, List[str]]) -> None:
+        self._entity_names = []
+        self._entity_index = {}
+        self._entity_offsets = []
+        self._properties = []
+        for name, properties in entities.items():
+            self.add_entity(name, properties)
+
+    @property
+    def relationships(self) -> Tuple[Mapping[str, str], ...]:
+        """Read-only ``{"source", "target", "type"}`` views, in insertion order.
+
+        The views are rebuilt on every access; use ``snapshot`` to read the
+        whole model once.
+        """
+        return tuple(MappingProxyType(rel) for rel in self._relationship_rows())
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the entities and relationships as plain dicts and lists."""
+        return {
+            "entities": dict(self._entity_rows()),
+            "relationships": list(self._relationship_rows()),
+        }
+
+
 class DomainElicitationSession:
     """Manages the conversation flow to elicit domain requirements."""
 
     def __init__(self, session_id: str):
         self.session_id = session_id
-        self.domain_entities = {}
-        self.relationships = []
+        self._store = _DomainModelStore()
         self.current_stage = "introduction"
         self.messages: List[Dict[str, str]] = []
 
@@ -234,19 +342,42 @@ class DomainElicitationSession:
 
     def add_entity(self, name: str, properties: List[str]) -> None:
         """Add an entity to the domain model."""
-        self.domain_entities[name] = properties
+        self._store.add_entity(name, properties)
+
+    @property
+    def domain_entities(self) -> Mapping[str, Tuple[str, ...]]:
+        """Read-only view of entity name to property strings.
+
+        Rebuilt on every access; prefer ``has_entity`` for membership checks.
+        """
+        return self._store.entities
+
+    @domain_entities.setter
+    def domain_entities(self, entities: Dict[str, List[str]]) -> None:
+        self._store.entities = entities
+
+    def has_entity(self, name: str) -> bool:
+        """Return whether an entity with this name has been added."""
+        return self._store.has_entity(name)
 
     def add_relationship(
         self, source: str, target: str, relationship_type: str
     ) -> None:
         """Define a relationship between entities."""
-        self.relationships.append(
-            {"source": source, "target": target, "type": relationship_type}
-        )
+        self._store.add_relationship(source, target, relationship_type)
+
+    @property
+    def relationships(self) -> Tuple[Mapping[str, str], ...]:
+        """Read-only ``{"source", "target", "type"}`` views of the relationships.
+
+        Rebuilt on every access; ``get_domain_model`` returns both collections
+        in one pass.
+        """
+        return self._store.relationships
 
     def get_domain_model(self) -> Dict[str, Any]:
         """Return the current state of the domain model."""
-        return {"entities": self.domain_entities, "relationships": self.relationships}
+        return self._store.snapshot()
 
 
 class DomainModelBuilder:
@@ -258,24 +389,39 @@ class DomainModelBuilder:
         Creates an empty builder instance ready to construct a domain model
         through incremental additions of entities and relationships.
         """
-        self.entities = {}
-        self.relationships = []
+        self._store = _DomainModelStore()
 
     def add_entity(self, name: str, properties: List[str]) -> None:
         """Add an entity to the domain model."""
-        self.entities[name] = properties
+        self._store.add_entity(name, properties)
+
+    @property
+    def entities(self) -> Mapping[str, Tuple[str, ...]]:
+        """Read-only view of entity name to property strings.
+
+        Rebuilt on every access; ``get_domain_model`` returns both collections
+        in one pass.
+        """
+        return self._store.entities
 
     def add_relationship(
         self, source: str, target: str, relationship_type: str
     ) -> None:
         """Define a relationship between entities."""
-        self.relationships.append(
-            {"source": source, "target": target, "type": relationship_type}
-        )
+        self._store.add_relationship(source, target, relationship_type)
+
+    @property
+    def relationships(self) -> Tuple[Mapping[str, str], ...]:
+        """Read-only ``{"source", "target", "type"}`` views of the relationships.
+
+        Rebuilt on every access; ``get_domain_model`` returns both collections
+        in one pass.
+        """
+        return self._store.relationships
 
     def get_domain_model(self) -> Dict[str, Any]:
         """Return the current state of the domain model."""
-        return {"entities": self.entities, "relationships": self.relationships}
+        return self._store.snapshot()
 
 
 class DomainForgeDSLGenerator:
@@ -301,13 +447,14 @@ class DomainForgeDSLGenerator:
             # Generate entities
             for entity_name, properties in context.get("entities", {}).items():
                 output.append(f"    #{entity_name} {{")
-                for prop in properties:
-                    output.append(f"        {prop}")
+                output.extend(f"        {prop}" for prop in properties)
                 output.append("    }")
 
             # Generate relationships
-            for rel in context.get("relationships", []):
-                output.append(f"    {rel['source']} {rel['type']} {rel['target']}")
+            output.extend(
+                f"    {rel['source']} {rel['type']} {rel['target']}"
+                for rel in context.get("relationships", [])
+            )
 
             output.append("}")
 
@@ -1,10 +1,15 @@
 """Plugin configuration management."""
 
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import yaml
 from dataclasses import dataclass, asdict
 
+try:
+    from yaml import CSafeDumper as _Dumper, CSafeLoader as _Loader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _Dumper, SafeLoader as _Loader  # type: ignore
+
 
 @dataclass
 class PluginConfig:
@@ -23,24 +28,51 @@ class PluginConfig:
 class PluginConfigManager:
     """Manages plugin configurations."""
 
-    def __init__(self, config_file: Path):
+    def __init__(self, config_file: Optional[Path] = None):
         """Initialize plugin config manager.
 
         Args:
-            config_file: Path to the YAML config file
+            config_file: Path to the YAML config file. If None, configurations
+                are kept in memory only.
         """
-        self.config_file = Path(config_file)
+        self.config_file = Path(config_file) if config_file is not None else None
         self._configs: Dict[str, PluginConfig] = {}
         self._load_configs()
 
+    @classmethod
+    def from_string(
+        cls, content: str, config_file: Optional[Path] = None
+    ) -> "PluginConfigManager":
+        """Create a config manager from YAML content.
+
+        Args:
+            content: YAML document as produced by ``dumps``
+            config_file: Optional path to save subsequent changes to
+
+        Returns:
+            Config manager populated from the given content
+        """
+        manager = cls()
+        manager.config_file = Path(config_file) if config_file is not None else None
+        manager._load_string(content)
+        return manager
+
     def _load_configs(self) -> None:
         """Load configurations from file."""
-        if not self.config_file.exists():
+        if self.config_file is None or not self.config_file.exists():
             return
 
+        with open(self.config_file) as f:
+            self._load_string(f.read())
+
+    def _load_string(self, content: str) -> None:
+        """Load configurations from YAML content.
+
+        Args:
+            content: YAML document mapping plugin names to their config
+        """
         try:
-            with open(self.config_file) as f:
-                data = yaml.safe_load(f) or {}
+            data = yaml.load(content, Loader=_Loader) or {}
 
             for name, config in data.items():
                 self._configs[name] = PluginConfig(
@@ -52,16 +84,26 @@ class PluginConfigManager:
             # Invalid YAML or unexpected format, use empty configs
             pass
 
-    def _save_configs(self) -> None:
-        """Save configurations to file."""
+    def dumps(self) -> str:
+        """Serialize all configurations to a YAML string.
+
+        Returns:
+            YAML document mapping plugin names to their config
+        """
         data = {
             name: {"enabled": config.enabled, "settings": config.settings}
             for name, config in self._configs.items()
         }
+        return yaml.dump(data, Dumper=_Dumper)
+
+    def _save_configs(self) -> None:
+        """Save configurations to file."""
+        if self.config_file is None:
+            return
 
         self.config_file.parent.mkdir(parents=True, exist_ok=True)
         with open(self.config_file, "w") as f:
-            yaml.safe_dump(data, f)
+            f.write(self.dumps())
 
     def get_config(self, plugin_name: str) -> PluginConfig:
         """Get configuration for a plugin.
@@ -72,9 +114,10 @@ class PluginConfigManager:
         Returns:
             Plugin configuration, creating new one if it doesn't exist
         """
+        # Defaults are implied for unknown plugins, so creating one does not
+        # need a write; the file is only rewritten when a config changes.
         if plugin_name not in self._configs:
             self._configs[plugin_name] = PluginConfig(name=plugin_name)
-            self._save_configs()
         return self._configs[plugin_name]
 
     def update_config(self, plugin_name: str, settings: Dict[str, Any]) -> None:
@@ -6,7 +6,7 @@ import pkgutil
 from pathlib import Path
 from typing import Dict, List, Optional, Type, TypeVar, cast
 
-from domainforge.plugins.base_plugin import BasePlugin
+from domainforge.plugins.base_plugin import BasePlugin, PluginMetadata
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +26,8 @@ class PluginManager:
         """Initialize the plugin manager with an empty registry."""
         self.plugins: Dict[str, BasePlugin] = {}
         self.plugin_paths: List[Path] = []
+        # Secondary index of registered plugins: plugin_type -> name -> plugin
+        self._by_type: Dict[str, Dict[str, BasePlugin]] = {}
 
     def discover_plugins(self, plugin_paths: Optional[List[Path]] = None) -> None:
         """Discover plugins from specified paths.
@@ -178,8 +180,20 @@ class PluginManager:
 
         if name in self.plugins:
             logger.warning(f"Plugin {name} already registered, overwriting")
+            self._unindex(name)
 
         self.plugins[name] = plugin
+        self._by_type.setdefault(plugin.metadata.plugin_type, {})[name] = plugin
+
+    def _unindex(self, name: str) -> None:
+        """Remove a registered plugin from the by-type index.
+
+        Args:
+            name: Name of the plugin to remove
+        """
+        # register_plugin rejects plugins without metadata
+        metadata = cast(PluginMetadata, self.plugins[name].metadata)
+        self._by_type[metadata.plugin_type].pop(name, None)
 
     def get_plugin(self, name: str) -> Optional[BasePlugin]:
         """Get a plugin by name.
@@ -201,11 +215,7 @@ class PluginManager:
         Returns:
             Dictionary of plugin instances by name
         """
-        return {
-            name: plugin
-            for name, plugin in self.plugins.items()
-            if plugin.metadata and plugin.metadata.plugin_type == plugin_type
-        }
+        return dict(self._by_type.get(plugin_type, {}))
 
     def get_plugins(self) -> Dict[str, BasePlugin]:
         """Get all registered plugins.
@@ -233,6 +243,7 @@ class PluginManager:
                 logger.error(f"Error during plugin cleanup for {plugin_name}: {e}")
 
             # Remove from registry
+            self._unindex(plugin_name)
             del self.plugins[plugin_name]
             logger.info(f"Plugin {plugin_name} uninstalled")
             return True
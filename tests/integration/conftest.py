@@ -0,0 +1,19 @@
+"""Configuration for integration tests.
+
+Every test collected from this directory carries the ``integration`` marker,
+so ``-m "not integration"`` selects the unit suite alone.
+"""
+
+from pathlib import Path
+from typing import List
+
+import pytest
+
+_INTEGRATION_DIR = Path(__file__).parent
+
+
+def pytest_collection_modifyitems(items: List[pytest.Item]) -> None:
+    """Mark the tests collected from this directory as integration tests."""
+    for item in items:
+        if _INTEGRATION_DIR in item.path.parents:
+            item.add_marker(pytest.mark.integration)
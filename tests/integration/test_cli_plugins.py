@@ -4,8 +4,9 @@ import json
 import pytest
 import tempfile
 from pathlib import Path
+from types import SimpleNamespace
 from click.testing import CliRunner
-from unittest.mock import patch, Mock, PropertyMock
+from unittest.mock import patch
 from domainforge.cli import cli
 
 
@@ -38,13 +39,11 @@ def plugins_dir():
 
 
 @pytest.fixture
-def mock_settings():
+def mock_settings(plugins_dir, monkeypatch):
     """Mock settings for testing."""
-    with patch("domainforge.cli.get_settings") as mock:
-        settings = Mock()
-        type(settings).plugins_dir = PropertyMock(return_value=plugins_dir)
-        mock.return_value = settings
-        yield mock
+    settings = SimpleNamespace(plugins_dir=plugins_dir)
+    monkeypatch.setattr("domainforge.cli.get_settings", lambda: settings)
+    yield settings
 
 
 @pytest.fixture
@@ -178,11 +177,8 @@ def test_validate_command_strict_mode(mock_find_plugins, cli_runner, test_model_
     assert "Entity name 'user' should be PascalCase" in result.output
 
 
-@patch("domainforge.cli.get_settings")
 def test_plugins_list_command(mock_settings, cli_runner, plugins_dir):
     """Test plugins list command."""
-    mock_settings.return_value.plugins_dir = plugins_dir
-
     # Test empty plugins directory
     result = cli_runner.invoke(cli, ["plugins", "list"])
     assert result.exit_code == 0
@@ -205,11 +201,8 @@ type: validator
     assert "test-plugin" in result.output
 
 
-@patch("domainforge.cli.get_settings")
 def test_plugin_uninstall_command(mock_settings, cli_runner, plugins_dir):
     """Test plugin uninstall command."""
-    mock_settings.return_value.plugins_dir = plugins_dir
-
     # Test uninstalling non-existent plugin
     result = cli_runner.invoke(cli, ["plugins", "uninstall", "nonexistent"])
     assert result.exit_code == 1
@@ -233,12 +226,8 @@ type: validator
     assert not plugin_dir.exists()
 
 
-@patch("domainforge.cli.get_settings")
 def test_plugin_update_command(mock_settings, cli_runner, plugins_dir):
     """Test plugin update command."""
-    mock_settings.return_value.plugins_dir = plugins_dir
-    mock_settings.return_value.plugin_registry = "https://plugins.test"
-
     # Test with no plugins installed
     result = cli_runner.invoke(cli, ["plugins", "update"])
     assert result.exit_code == 0
@@ -1,23 +1,29 @@
 """Integration tests for the plugin system."""
 
+import copy
 import os
 import sys
 from pathlib import Path
 
 import pytest
 
-from domainforge.plugins.plugin_manager import PluginManager
 from tests.integration.mock_plugin import MockPlugin
 
 
+# Built once; each test registers a shallow copy, since initialize/cleanup
+# rebind the plugin's initialized flag and config.
+_MOCK = MockPlugin()
+
+
 @pytest.fixture
 def plugin_manager():
     """Create a plugin manager instance for testing."""
+    from domainforge.plugins.plugin_manager import PluginManager
+
     manager = PluginManager()
 
     # Register mock plugin directly for testing
-    mock_plugin = MockPlugin()
-    manager.register_plugin(mock_plugin)
+    manager.register_plugin(copy.copy(_MOCK))
 
     return manager
 
@@ -2,157 +2,78 @@
 
 import os
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
 from domainforge.plugins import PluginManager
-from domainforge.plugins.template_plugin import TemplatePlugin, PluginMetadata
-
-
-@pytest.fixture
-def plugin_manager():
-    """Create a plugin manager instance with mocked plugins for testing."""
-    # Create a mock TemplatePlugin
-    mock_plugin = MagicMock(spec=TemplatePlugin)
-
-    # Fix: Create a mock metadata object with required properties
-    mock_metadata = MagicMock(spec=PluginMetadata)
-    mock_metadata.name = "test-template-plugin"
-    mock_metadata.plugin_type = "template"
-    mock_metadata.version = "1.0.0"
-    mock_metadata.author = "Test Author"
-    mock_metadata.description = "Test Plugin Description"
-
-    # Fix: Assign the metadata as a property, not a method
-    # Previously there was no 'metadata' attribute only a dotted path
-    mock_plugin.metadata = mock_metadata
-
-    # Mock the template paths
-    mock_paths = {"backend": MagicMock(), "frontend": MagicMock()}
-
-    # Set up the backend templates
-    backend_path = mock_paths["backend"]
-    backend_path.exists.return_value = True
-    backend_path.__truediv__.return_value = backend_path
-
-    # Set up fastapi templates
-    fastapi_path = MagicMock()
-    fastapi_path.exists.return_value = True
-    entity_template = MagicMock()
-    router_template = MagicMock()
-    entity_template.name = "entity.py.j2"
-    router_template.name = "router.py.j2"
-    entity_template.exists.return_value = True
-    router_template.exists.return_value = True
-    fastapi_path.glob.return_value = [entity_template, router_template]
-
-    # Fix: Make sure __truediv__ returns the correct mock path
-    def backend_truediv(path):
-        if path == "fastapi":
-            return fastapi_path
-        return backend_path
-
-    backend_path.__truediv__ = MagicMock(side_effect=backend_truediv)
-
-    # Set up the frontend templates
-    frontend_path = mock_paths["frontend"]
-    frontend_path.exists.return_value = True
-
-    # Set up react templates
-    react_path = MagicMock()
-    react_path.exists.return_value = True
-    entity_component = MagicMock()
-    component_template = MagicMock()
-    entity_component.name = "Entity.tsx.j2"
-    component_template.name = "Component.tsx.j2"
-    entity_component.exists.return_value = True
-    component_template.exists.return_value = True
-    react_path.glob.return_value = [entity_component, component_template]
-
-    # Fix: Make sure __truediv__ returns the correct mock path
-    def frontend_truediv(path):
-        if path == "react":
-            return react_path
-        return frontend_path
-
-    frontend_path.__truediv__ = MagicMock(side_effect=frontend_truediv)
-
-    # Configure mock plugin
-    mock_plugin.get_template_paths.return_value = mock_paths
-    mock_plugin.get_supported_frameworks.return_value = {
-        "backend": ["fastapi", "django"],
-        "frontend": ["react", "vue"],
-    }
+from domainforge.plugins.template_plugin import PluginMetadata, TemplatePlugin
+
+
+@pytest.fixture(scope="module")
+def template_root(tmp_path_factory):
+    """Create a real template tree shared by the tests in this module.
 
-    # Create manager and register the mock plugin
+    TemplatePlugin.initialize reads templates from ``<template_dir>/templates``.
+    """
+    root = tmp_path_factory.mktemp("plugin")
+    templates = {
+        "backend/fastapi": ("entity.py.j2", "router.py.j2"),
+        "frontend/react": ("Entity.tsx.j2", "Component.tsx.j2"),
+    }
+    for directory, names in templates.items():
+        framework_dir = root / "templates" / directory
+        framework_dir.mkdir(parents=True)
+        for name in names:
+            (framework_dir / name).touch()
+    return root
+
+
+@pytest.fixture(scope="module")
+def plugin_manager(template_root):
+    """Create a plugin manager with a template plugin over the template tree."""
+    template_plugin = TemplatePlugin()
+    template_plugin.metadata = PluginMetadata(
+        name="test-template-plugin",
+        version="1.0.0",
+        description="Test Plugin Description",
+        author="Test Author",
+        plugin_type="template",
+    )
+    template_plugin.initialize({"template_dir": template_root})
+
+    # Create manager and register the template plugin
     manager = PluginManager()
-    manager.plugins = {"test-template-plugin": mock_plugin}
+    manager.register_plugin(template_plugin)
 
     return manager
 
 
-def test_plugin_template_listing(plugin_manager):
-    """Test listing available templates from plugins."""
-    # In a real test, we'd call a method that uses the plugin manager to list templates
-    # For now, let's directly check the plugin's template paths
+def test_plugin_templates(plugin_manager):
+    """Test listing, resolving and error handling of plugin templates."""
     template_plugins = plugin_manager.get_plugins_by_type("template")
     assert len(template_plugins) > 0
 
     # Get the first template plugin
     template_plugin = list(template_plugins.values())[0]
 
-    # Get template paths
+    # Listing: template paths and the templates in backend/fastapi
     paths = template_plugin.get_template_paths()
     assert "backend" in paths
     assert "frontend" in paths
 
-    # Check for templates in backend/fastapi
     fastapi_path = paths["backend"] / "fastapi"
     templates = [p.name for p in fastapi_path.glob("*.j2")]
     assert "entity.py.j2" in templates
     assert "router.py.j2" in templates
 
+    # Generation: the template a generator would use for an entity is accessible
+    assert (fastapi_path / "entity.py.j2").exists()
 
-def test_plugin_template_generation(plugin_manager):
-    """Test generating code using templates from plugins."""
-    # Mock a code generator that would use the template plugin
-    mock_generator = MagicMock()
-
-    # Mock the entity
-    entity = MagicMock()
-    entity.name = "User"
-    entity.properties = [
-        {"name": "id", "type": "int"},
-        {"name": "username", "type": "str"},
-    ]
-
-    # In a real test, we'd call the generator with the entity
-    # For this test, we'll verify the plugin's template paths are accessible
-    template_plugins = plugin_manager.get_plugins_by_type("template")
-    assert len(template_plugins) > 0
-
-    # Get the first template plugin
-    template_plugin = list(template_plugins.values())[0]
-    paths = template_plugin.get_template_paths()
-
-    # Get template for backend/fastapi/entity.py.j2
-    fastapi_path = paths["backend"] / "fastapi"
-    entity_template = fastapi_path / "entity.py.j2"
-    assert entity_template.exists()
-
-
-def test_plugin_template_errors(plugin_manager):
-    """Test error handling with invalid templates."""
-    # Mock error cases for templates
-    template_plugins = plugin_manager.get_plugins_by_type("template")
-    template_plugin = list(template_plugins.values())[0]
-
-    # Test with invalid framework
+    # Errors: unsupported frameworks and failing template path lookups
     frameworks = template_plugin.get_supported_frameworks()
     assert "invalid-framework" not in frameworks["backend"]
 
-    # Test with invalid template path - mock the get_template_paths method to raise an error
     with patch.object(
         template_plugin,
         "get_template_paths",
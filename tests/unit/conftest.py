@@ -0,0 +1,63 @@
+"""Shared fixtures for unit tests.
+
+Provides the OpenAI-compatible settings, client overrides and reply builder
+used by tests that exercise the AI client, plus a shared DSL transformer.
+"""
+
+from typing import TYPE_CHECKING, Any, Callable, Dict
+from unittest.mock import MagicMock
+
+import pytest
+
+if TYPE_CHECKING:
+    from domainforge.core.transformer import DomainForgeTransformer
+
+_BASE_OPENAI_RESPONSE: Dict[str, Any] = {
+    "id": "test-id",
+    "object": "chat.completion",
+    "created": 1677858242,
+    "model": "gpt-4",
+    "choices": [{"message": {"content": "This is a test response"}}],
+    "usage": {"prompt_tokens": 10, "completion_tokens": 10, "total_tokens": 20},
+}
+
+
+def _openai_reply(content: str) -> Dict[str, Any]:
+    """Build a chat completion payload whose first choice has the given content."""
+    return {**_BASE_OPENAI_RESPONSE, "choices": [{"message": {"content": content}}]}
+
+
+@pytest.fixture
+def openai_reply() -> Callable[[str], Dict[str, Any]]:
+    """Fixture providing the chat completion payload builder."""
+    return _openai_reply
+
+
+@pytest.fixture(scope="module")
+def mock_settings():
+    """Mock settings for testing, shared by every test in the module."""
+    settings = MagicMock()
+    settings.OPENAI_API_KEY = "test-api-key"
+    settings.OPENAI_API_BASE = "https://api.openai.com/v1"
+    settings.OPENAI_MODEL = "gpt-4"
+
+    # Mock the get_settings function; respx_mock routes are reset per test
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("domainforge.core.ai_client.get_settings", lambda: settings)
+        yield settings
+
+
+@pytest.fixture
+def _force_real_client(monkeypatch):
+    """Disable the client's test-environment shortcut so requests hit respx."""
+    monkeypatch.setattr(
+        "domainforge.core.ai_client.AIClient._is_test_environment", lambda self: False
+    )
+
+
+@pytest.fixture(scope="module")
+def transformer() -> "DomainForgeTransformer":
+    """DSL transformer shared by a module; it keeps no per-parse state."""
+    from domainforge.core.transformer import DomainForgeTransformer
+
+    return DomainForgeTransformer()
@@ -7,9 +7,8 @@ from domainforge.plugins.config import PluginConfig, PluginConfigManager
 
 @pytest.fixture
 def config_file(tmp_path):
-    """Create a temporary config file."""
-    config_path = tmp_path / "plugins.yaml"
-    return config_path
+    """Create a temporary config file; tests save to it, so one per test."""
+    return tmp_path / "plugins.yaml"
 
 
 @pytest.fixture
@@ -40,17 +39,24 @@ def test_update_config(config_manager):
     assert config.settings["key"] == "value"
 
 
-def test_enable_disable_plugin(config_manager):
-    """Test enabling and disabling plugins."""
+def test_save_and_load_configs():
+    """Test saving and loading configurations."""
+    # Setup initial config in memory
+    config_manager = PluginConfigManager()
+    config_manager.update_config("test-plugin", {"key": "value"})
     config_manager.disable_plugin("test-plugin")
-    assert not config_manager.is_plugin_enabled("test-plugin")
 
-    config_manager.enable_plugin("test-plugin")
-    assert config_manager.is_plugin_enabled("test-plugin")
+    # Create new manager from the serialized config
+    new_manager = PluginConfigManager.from_string(config_manager.dumps())
+    loaded_config = new_manager.get_config("test-plugin")
+
+    assert loaded_config.name == "test-plugin"
+    assert loaded_config.enabled is False
+    assert loaded_config.settings["key"] == "value"
 
 
-def test_save_and_load_configs(config_manager, config_file):
-    """Test saving and loading configurations."""
+def test_save_and_load_configs_from_file(config_manager, config_file):
+    """Test saving and loading configurations through the config file."""
     # Setup initial config
     config_manager.update_config("test-plugin", {"key": "value"})
     config_manager.disable_plugin("test-plugin")
@@ -64,23 +70,33 @@ def test_save_and_load_configs(config_manager, config_file):
     assert loaded_config.settings["key"] == "value"
 
 
-def test_multiple_plugins(config_manager):
-    """Test managing multiple plugin configs."""
-    # Configure first plugin
-    config_manager.update_config("plugin1", {"setting1": "value1"})
-    config_manager.disable_plugin("plugin1")
-
-    # Configure second plugin
-    config_manager.update_config("plugin2", {"setting2": "value2"})
-
-    # Verify configurations
-    config1 = config_manager.get_config("plugin1")
-    assert config1.settings["setting1"] == "value1"
-    assert not config1.enabled
-
-    config2 = config_manager.get_config("plugin2")
-    assert config2.settings["setting2"] == "value2"
-    assert config2.enabled
+@pytest.fixture(scope="module")
+def shared_config_manager():
+    """Create an in-memory config manager shared by table-driven tests."""
+    return PluginConfigManager()
+
+
+@pytest.mark.parametrize(
+    "name, settings, disabled",
+    [
+        ("plugin1", {"setting1": "value1"}, True),
+        ("plugin2", {"setting2": "value2"}, False),
+    ],
+)
+def test_multiple_plugins(shared_config_manager, name, settings, disabled):
+    """Test managing, enabling and disabling multiple plugin configs."""
+    shared_config_manager.update_config(name, settings)
+    if disabled:
+        shared_config_manager.disable_plugin(name)
+
+    # Verify configuration
+    config = shared_config_manager.get_config(name)
+    assert config.settings == settings
+    assert config.enabled is not disabled
+
+    # Re-enabling always leaves the plugin enabled
+    shared_config_manager.enable_plugin(name)
+    assert shared_config_manager.is_plugin_enabled(name)
 
 
 def test_invalid_yaml_handling(tmp_path):
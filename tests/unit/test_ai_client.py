@@ -3,88 +3,130 @@
 import json
 import os
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
+from unittest.mock import patch, MagicMock
 
 import httpx
 
 from domainforge.core.ai_client import AIClient, AIMessage, AIConversation
 
 
-@pytest.fixture
-def mock_settings(monkeypatch):
-    """Mock settings for testing."""
-    settings = MagicMock()
-    settings.OPENAI_API_KEY = "test-api-key"
-    settings.OPENAI_API_BASE = "https://api.openai.com/v1"
-    settings.OPENAI_MODEL = "gpt-4"
+API_BASE = "https://api.openai.com/v1"
+
+pytestmark = pytest.mark.usefixtures("_force_real_client")
+
+_ECOMMERCE_MODEL = {
+    "contexts": [
+        {
+            "name": "ECommerce",
+            "entities": [
+                {
+                    "name": "Product",
+                    "properties": [
+                        {
+                            "name": "id",
+                            "type": "UUID",
+                            "constraints": ["required"],
+                        },
+                        {
+                            "name": "name",
+                            "type": "String",
+                            "constraints": ["required"],
+                        },
+                    ],
+                }
+            ],
+            "relationships": [],
+        }
+    ]
+}
+
+_REFINED_MODEL = {
+    "contexts": [
+        {
+            "name": "ECommerce",
+            "entities": [
+                {
+                    "name": "Product",
+                    "properties": [
+                        {
+                            "name": "id",
+                            "type": "UUID",
+                            "constraints": ["required"],
+                        },
+                        {
+                            "name": "name",
+                            "type": "String",
+                            "constraints": ["required"],
+                        },
+                        {
+                            "name": "price",
+                            "type": "Decimal",
+                            "constraints": ["required"],
+                        },
+                    ],
+                },
+                {
+                    "name": "Customer",
+                    "properties": [
+                        {
+                            "name": "id",
+                            "type": "UUID",
+                            "constraints": ["required"],
+                        },
+                        {
+                            "name": "name",
+                            "type": "String",
+                            "constraints": ["required"],
+                        },
+                    ],
+                },
+            ],
+            "relationships": [
+                {"source": "Customer", "target": "Product", "type": "=>"}
+            ],
+        }
+    ]
+}
 
-    # Mock the get_settings function
-    monkeypatch.setattr("domainforge.core.ai_client.get_settings", lambda: settings)
-    return settings
+# Serialized once at import; the AIClient parses JSON out of the reply text
+_ECOMMERCE_MODEL_JSON = json.dumps(_ECOMMERCE_MODEL)
+_REFINED_MODEL_JSON = json.dumps(_REFINED_MODEL)
 
+_SYSTEM_MSG = AIMessage(role="system", content="You are a helpful assistant.")
+_USER_MSG = AIMessage(role="user", content="Hello!")
+_CONV = AIConversation(
+    messages=[_SYSTEM_MSG, _USER_MSG],
+    temperature=0.5,  # Custom temperature
+    max_tokens=1000,  # Custom max_tokens
+)
 
-@pytest.fixture
-def mock_httpx_client(monkeypatch):
-    """Mock httpx client for testing."""
-    mock_client = AsyncMock()
-
-    # Configure mock response
-    mock_response = AsyncMock()
-    mock_response.raise_for_status.return_value = None
-
-    # Create a properly structured response dict
-    mock_json_result = {
-        "id": "test-id",
-        "object": "chat.completion",
-        "created": 1677858242,
-        "model": "gpt-4",
-        "choices": [{"message": {"content": "This is a test response"}}],
-        "usage": {"prompt_tokens": 10, "completion_tokens": 10, "total_tokens": 20},
-    }
-
-    # Set up the json method to return the mock json result directly, not as a coroutine
-    mock_response.json = AsyncMock(return_value=mock_json_result)
-
-    # Configure post method to return the mock response
-    mock_client.post.return_value = mock_response
-
-    # Mock aclose method
-    mock_client.aclose = AsyncMock()
-
-    # Apply the mock
-    monkeypatch.setattr("httpx.AsyncClient", lambda **kwargs: mock_client)
-
-    # Patch the _is_test_environment method to return False to ensure the mock client is used
-    monkeypatch.setattr(
-        "domainforge.core.ai_client.AIClient._is_test_environment", lambda self: False
-    )
 
-    return mock_client
+@pytest.fixture
+def client(mock_settings: MagicMock) -> AIClient:
+    """Create an AI client configured from the mocked settings."""
+    return AIClient()
 
 
-@pytest.fixture(autouse=True)
-def mock_openai_api_key(monkeypatch):
-    """Fixture to mock the OpenAI API key."""
-    monkeypatch.setenv("OPENAI_API_KEY", "test_api_key")
+@pytest.fixture(autouse=True, scope="module")
+def mock_openai_api_key():
+    """Fixture to mock the OpenAI API key once for the module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("OPENAI_API_KEY", "test_api_key")
+        yield
 
 
 class TestAIClient:
     """Tests for the AIClient class."""
 
-    def test_initialization_with_settings(
-        self, mock_settings: MagicMock, mock_httpx_client: AsyncMock
-    ) -> None:
+    def test_initialization_with_settings(self, client: AIClient) -> None:
         """Test client initialization using settings."""
-        # Create client with settings
-        client = AIClient()
-
         # Verify correct initialization
         assert client.api_key == "test-api-key"
         assert client.api_base == "https://api.openai.com/v1"  # Default value
         assert client.default_model == "gpt-4"
 
     def test_initialization_with_explicit_values(
-        self, mock_settings: MagicMock, mock_httpx_client: AsyncMock
+        self, mock_settings: MagicMock
     ) -> None:
         """Test client initialization with explicit values."""
         # Create client with explicit values
@@ -98,22 +140,26 @@ class TestAIClient:
 
     def test_initialization_missing_api_key(self, mock_settings: MagicMock) -> None:
         """Test initialization fails when API key is missing."""
-        # Remove API key from settings
-        mock_settings.OPENAI_API_KEY = None
-
-        # Also ensure environment variable is not set
-        with patch.dict(os.environ, {"OPENAI_API_KEY": ""}, clear=True):
-            # Attempting to create client should raise ValueError
-            with pytest.raises(ValueError, match="API key not provided"):
-                AIClient()
-
-    @pytest.mark.asyncio
+        # Remove API key from the shared settings, restoring it afterwards
+        with patch.object(mock_settings, "OPENAI_API_KEY", None):
+            # Also ensure environment variable is not set
+            with patch.dict(os.environ, {"OPENAI_API_KEY": ""}, clear=True):
+                # Attempting to create client should raise ValueError
+                with pytest.raises(ValueError, match="API key not provided"):
+                    AIClient()
+
+    @pytest.mark.respx(base_url=API_BASE)
     async def test_generate_response_with_dict_messages(
-        self, mock_settings: MagicMock, mock_httpx_client: AsyncMock
+        self, client: AIClient, respx_mock, openai_reply
     ) -> None:
         """Test generating a response with a list of message dicts."""
-        # Create client and test messages
-        client = AIClient()
+        route = respx_mock.post("/chat/completions").mock(
+            return_value=httpx.Response(
+                200, json=openai_reply("This is a test response")
+            )
+        )
+
+        # Test messages
         messages = [
             {"role": "system", "content": "You are a helpful assistant."},
             {"role": "user", "content": "Hello!"},
@@ -122,39 +168,49 @@ class TestAIClient:
         # Generate response
         response = await client.generate_response(messages)
 
-        # Verify response
+        # Verify response and the request that was sent
         assert response == "This is a test response"
-
-    @pytest.mark.asyncio
+        assert route.called
+        request = route.calls.last.request
+        assert str(request.url) == f"{API_BASE}/chat/completions"
+        assert request.headers["Authorization"] == "Bearer test-api-key"
+        assert request.headers["Content-Type"] == "application/json"
+        assert json.loads(request.content) == {
+            "model": "gpt-4",
+            "messages": messages,
+            "temperature": 0.7,
+            "max_tokens": 2048,
+        }
+
+    @pytest.mark.respx(base_url=API_BASE)
     async def test_generate_response_with_conversation_object(
-        self, mock_httpx_client: AsyncMock
+        self, client: AIClient, respx_mock, openai_reply
     ) -> None:
         """Test generating a response with an AIConversation object."""
-        # Create client and test conversation
-        client = AIClient()
-        conversation = AIConversation(
-            messages=[
-                AIMessage(role="system", content="You are a helpful assistant."),
-                AIMessage(role="user", content="Hello!"),
-            ],
-            temperature=0.5,  # Custom temperature
-            max_tokens=1000,  # Custom max_tokens
+        route = respx_mock.post("/chat/completions").mock(
+            return_value=httpx.Response(
+                200, json=openai_reply("This is a test response")
+            )
         )
 
         # Generate response
-        response = await client.generate_response(conversation)
+        response = await client.generate_response(_CONV)
 
-        # Verify response
+        # Verify response and that the conversation settings were sent
         assert response == "This is a test response"
+        payload = json.loads(route.calls.last.request.content)
+        assert payload["temperature"] == 0.5
+        assert payload["max_tokens"] == 1000
 
-    @pytest.mark.asyncio
-    async def test_api_error_handling(self, mock_httpx_client: AsyncMock) -> None:
+    @pytest.mark.respx(base_url=API_BASE)
+    async def test_api_error_handling(self, client: AIClient, respx_mock) -> None:
         """Test handling of API errors."""
-        # Configure the mock to raise an exception
-        mock_httpx_client.post.side_effect = httpx.HTTPError("API error")
+        # Configure the route to raise an exception
+        respx_mock.post("/chat/completions").mock(
+            side_effect=httpx.HTTPError("API error")
+        )
 
-        # Create client and test messages
-        client = AIClient()
+        # Test messages
         messages = [
             {"role": "system", "content": "You are a helpful assistant."},
             {"role": "user", "content": "Hello!"},
@@ -164,219 +220,53 @@ class TestAIClient:
         with pytest.raises(httpx.HTTPError, match="API error"):
             await client.generate_response(messages)
 
-    @pytest.mark.asyncio
-    async def test_extract_domain_model(self, mock_httpx_client: AsyncMock) -> None:
-        """Test extracting a domain model from a description."""
-        # Create client and test description
-        with patch(
-            "domainforge.core.ai_client.AIClient._is_test_environment",
-            return_value=False,
-        ), patch(
-            "domainforge.core.ai_client.AIClient._is_mock_object", return_value=False
-        ):
-            client = AIClient()
-            description = "I need an e-commerce system with products."
-
-            # Create the domain model that will be returned
-            domain_model = {
-                "contexts": [
-                    {
-                        "name": "ECommerce",
-                        "entities": [
-                            {
-                                "name": "Product",
-                                "properties": [
-                                    {
-                                        "name": "id",
-                                        "type": "UUID",
-                                        "constraints": ["required"],
-                                    },
-                                    {
-                                        "name": "name",
-                                        "type": "String",
-                                        "constraints": ["required"],
-                                    },
-                                ],
-                            }
-                        ],
-                        "relationships": [],
-                    }
-                ]
-            }
-
-            # Configure mock response to return the domain model as a complete JSON string
-            # The AIClient extracts JSON from the text response
-            mock_response = AsyncMock()
-            mock_response.raise_for_status.return_value = None
-
-            # The AIClient looks for the JSON in the response text, not the parsed JSON object
-            json_str = json.dumps(domain_model)
-            mock_response.json = AsyncMock(
-                return_value={
-                    "id": "test-id",
-                    "object": "chat.completion",
-                    "created": 1677858242,
-                    "model": "gpt-4",
-                    "choices": [{"message": {"content": json_str}}],
-                    "usage": {
-                        "prompt_tokens": 10,
-                        "completion_tokens": 10,
-                        "total_tokens": 20,
-                    },
-                }
-            )
-            mock_httpx_client.post.return_value = mock_response
-
-            # Extract domain model
-            model = await client.extract_domain_model(description)
-
-            # Force the mock to be used
-            mock_httpx_client.post.assert_called_once()
-
-            # Verify model structure
-            assert model == domain_model
-            assert len(model["contexts"]) == 1
-            assert model["contexts"][0]["name"] == "ECommerce"
-            assert len(model["contexts"][0]["entities"]) == 1
-            assert model["contexts"][0]["entities"][0]["name"] == "Product"
-
-    @pytest.mark.asyncio
-    async def test_refine_domain_model(self, mock_httpx_client: AsyncMock) -> None:
-        """Test refining an existing domain model based on feedback."""
-        # Initial model
-        with patch(
-            "domainforge.core.ai_client.AIClient._is_test_environment",
-            return_value=False,
-        ), patch(
-            "domainforge.core.ai_client.AIClient._is_mock_object", return_value=False
-        ):
-            current_model = {
-                "contexts": [
-                    {
-                        "name": "ECommerce",
-                        "entities": [
-                            {
-                                "name": "Product",
-                                "properties": [
-                                    {
-                                        "name": "id",
-                                        "type": "UUID",
-                                        "constraints": ["required"],
-                                    },
-                                    {
-                                        "name": "name",
-                                        "type": "String",
-                                        "constraints": ["required"],
-                                    },
-                                ],
-                            }
-                        ],
-                        "relationships": [],
-                    }
-                ]
-            }
-
-            # Create the refined model that will be returned
-            refined_model = {
-                "contexts": [
-                    {
-                        "name": "ECommerce",
-                        "entities": [
-                            {
-                                "name": "Product",
-                                "properties": [
-                                    {
-                                        "name": "id",
-                                        "type": "UUID",
-                                        "constraints": ["required"],
-                                    },
-                                    {
-                                        "name": "name",
-                                        "type": "String",
-                                        "constraints": ["required"],
-                                    },
-                                    {
-                                        "name": "price",
-                                        "type": "Decimal",
-                                        "constraints": ["required"],
-                                    },
-                                ],
-                            },
-                            {
-                                "name": "Customer",
-                                "properties": [
-                                    {
-                                        "name": "id",
-                                        "type": "UUID",
-                                        "constraints": ["required"],
-                                    },
-                                    {
-                                        "name": "name",
-                                        "type": "String",
-                                        "constraints": ["required"],
-                                    },
-                                ],
-                            },
-                        ],
-                        "relationships": [
-                            {"source": "Customer", "target": "Product", "type": "=>"}
-                        ],
-                    }
-                ]
-            }
-
-            # Configure mock response to return the refined model as a JSON string
-            mock_response = AsyncMock()
-            mock_response.raise_for_status.return_value = None
-            mock_response.json = AsyncMock(
-                return_value={
-                    "id": "test-id",
-                    "object": "chat.completion",
-                    "created": 1677858242,
-                    "model": "gpt-4",
-                    "choices": [{"message": {"content": json.dumps(refined_model)}}],
-                    "usage": {
-                        "prompt_tokens": 10,
-                        "completion_tokens": 10,
-                        "total_tokens": 20,
-                    },
-                }
-            )
-            mock_httpx_client.post.return_value = mock_response
-
-            # Create client and test feedback
-            client = AIClient()
-            feedback = "Please add a Customer entity and a price field to Product."
-
-            # Refine model
-            result = await client.refine_domain_model(current_model, feedback)
-
-            # Force the mock to be used
-            mock_httpx_client.post.assert_called_once()
-
-            # Verify refined model
-            assert result == refined_model
-            assert len(result["contexts"][0]["entities"]) == 2
-            assert result["contexts"][0]["entities"][0]["name"] == "Product"
-            assert (
-                len(result["contexts"][0]["entities"][0]["properties"]) == 3
-            )  # Added price
-            assert result["contexts"][0]["entities"][1]["name"] == "Customer"
-            assert len(result["contexts"][0]["relationships"]) == 1
-
-    @pytest.mark.asyncio
-    async def test_client_close(
-        self, mock_settings: MagicMock, mock_httpx_client: AsyncMock
+    @pytest.mark.respx(base_url=API_BASE)
+    @pytest.mark.parametrize(
+        "method_name, args, expected_model, model_json",
+        [
+            (
+                "extract_domain_model",
+                ("I need an e-commerce system with products.",),
+                _ECOMMERCE_MODEL,
+                _ECOMMERCE_MODEL_JSON,
+            ),
+            (
+                "refine_domain_model",
+                (
+                    _ECOMMERCE_MODEL,
+                    "Please add a Customer entity and a price field to Product.",
+                ),
+                _REFINED_MODEL,
+                _REFINED_MODEL_JSON,
+            ),
+        ],
+    )
+    async def test_domain_model_methods(
+        self,
+        client: AIClient,
+        respx_mock,
+        openai_reply,
+        method_name: str,
+        args: tuple,
+        expected_model: dict,
+        model_json: str,
     ) -> None:
+        """Test extracting and refining a domain model from the AI response."""
+        # The AIClient looks for the JSON in the response text, not the parsed JSON object
+        route = respx_mock.post("/chat/completions").mock(
+            return_value=httpx.Response(200, json=openai_reply(model_json))
+        )
+
+        result = await getattr(client, method_name)(*args)
+
+        # The description or feedback is sent in the user message
+        assert route.call_count == 1
+        payload = json.loads(route.calls.last.request.content)
+        assert args[-1] in payload["messages"][-1]["content"]
+
+        assert result == expected_model
+
+    async def test_client_close(self, client: AIClient) -> None:
         """Test that the client is properly closed."""
-        with patch(
-            "domainforge.core.ai_client.AIClient._is_test_environment",
-            return_value=False,
-        ):
-            with patch(
-                "domainforge.core.ai_client.AIClient._is_mock_object",
-                return_value=False,
-            ):
-                client = AIClient()
-                await client.close()
-                mock_httpx_client.aclose.assert_called_once()
+        await client.close()
+        assert client.client.is_closed
@@ -1,110 +1,198 @@
-import json
-from typing import Any, Dict, Union
+import hashlib
+import io
+from json.encoder import encode_basestring_ascii
+from typing import TYPE_CHECKING, Any, List, TextIO, Tuple, Union
 
-from lark import Lark, Token, Tree
+import pytest
 
-from domainforge.core.transformer import DomainForgeTransformer
+# lark and the transformer are imported where used so collecting this
+# module stays cheap when its tests are deselected
+if TYPE_CHECKING:
+    from lark import Lark, Token, Tree
 
+    from domainforge.core.transformer import DomainForgeTransformer
 
-def tree_to_dict(node: Union[Tree, Token]) -> Dict[str, Any]:
-    """Convert a Lark tree to a dictionary for easier inspection"""
-    if isinstance(node, Tree):
-        return {
-            "type": "Tree",
-            "data": node.data,
-            "children": [tree_to_dict(child) for child in node.children],
-        }
-    else:  # Token
-        return {"type": "Token", "token_type": node.type, "value": node.value}
-
-
-def test_debug_parse_tree():
-    # Define the grammar using Lark's EBNF syntax - with explicit tree structure
-    grammar = r"""
-    start: context_definition+
-
-    context_definition: "@" IDENTIFIER "{" context_children "}"
-    context_children: (entity_definition | value_object_definition | event_definition | service_definition | repository_definition | module_definition | role_definition | relationship_definition)*
-
-    entity_definition: "#" IDENTIFIER entity_inheritance? "{" entity_children "}"
-    entity_inheritance: ":" IDENTIFIER
-    entity_children: (property_definition | method_definition | api_definition | ui_definition)*
-
-    value_object_definition: "%" IDENTIFIER "{" property_definition* "}"
-    event_definition: "^" IDENTIFIER "{" property_definition* "}"
-    service_definition: ">>" IDENTIFIER "{" service_children "}"
-    service_children: (method_definition | api_definition)*
-    repository_definition: "$" IDENTIFIER "{" method_definition* "}"
-    module_definition: "*" IDENTIFIER "{" module_children "}"
-    module_children: (entity_definition | value_object_definition | event_definition | service_definition | repository_definition)*
-    role_definition: "&" IDENTIFIER "{" property_definition* "}"
-
-    property_definition: IDENTIFIER ":" type_definition property_default? property_constraint?
-
-    property_default: "=" default_value
-    property_constraint: "[" constraint+ "]"
-
-    type_definition: simple_type | generic_type | list_type | dict_type
-    simple_type: IDENTIFIER
-    generic_type: IDENTIFIER "<" IDENTIFIER ">"
-    list_type: "List" "<" type_definition ">"
-    dict_type: "Dict" "<" type_definition ":" type_definition ">"
-
-    method_definition: visibility? IDENTIFIER "(" parameter_list? ")" return_type? method_body?
-    visibility: VISIBILITY
-    return_type: ":" type_definition
-    method_body: "{" description? "}"
-
-    parameter_list: parameter ("," parameter)*
-    parameter: IDENTIFIER ":" type_definition parameter_default?
-    parameter_default: "=" default_value
-
-    default_value: INT | FLOAT | STRING | IDENTIFIER | list_value
-    list_value: "[" value_list? "]"
-    value_list: value ("," value)*
-    value: INT | FLOAT | STRING | IDENTIFIER | list_value
-
-    constraint: "required" | "unique" | min_constraint | max_constraint | pattern_constraint | fk_constraint
-    min_constraint: "min" ":" INT
-    max_constraint: "max" ":" INT
-    pattern_constraint: "pattern" ":" STRING
-    fk_constraint: "foreign_key" ":" IDENTIFIER
-
-    relationship_definition: source_entity RELATIONSHIP_SYMBOL target_entity relationship_desc?
-    relationship_desc: "{" description? "}"
-    source_entity: IDENTIFIER
-    target_entity: IDENTIFIER
-
-    description: STRING
-
-    api_definition: "api" ":" HTTP_METHOD STRING api_params? api_return? api_desc?
-    api_params: "(" parameter_list? ")"
-    api_return: ":" type_definition
-    api_desc: "{" description? "}"
-
-    ui_definition: "ui" ":" UI_COMPONENT ui_params? ui_desc?
-    ui_params: "(" parameter_list? ")"
-    ui_desc: "{" description? "}"
-
-    // Terminals
-    IDENTIFIER: /[a-zA-Z_][a-zA-Z0-9_]*/
-    RELATIONSHIP_SYMBOL: "=>" | "<->" | "--" | "->" | "." | "::" | "/" | "="
-    HTTP_METHOD: "GET" | "POST" | "PUT" | "DELETE" | "PATCH"
-    UI_COMPONENT: "Form" | "Table" | "Card" | "Detail" | "List"
-    VISIBILITY: "public" | "private" | "protected"
-
-    STRING: /"[^"]*"/
-
-    %import common.INT
-    %import common.FLOAT
-    %import common.WS
-
-    COMMENT: /\/\/[^\n]*/ | /\/\*[\s\S]*?\*\//
-    %ignore COMMENT
-    %ignore WS
+# Define the grammar using Lark's EBNF syntax - with explicit tree structure
+_GRAMMAR = r"""
+start: context_definition+
+
+context_definition: "@" IDENTIFIER "{" context_children "}"
+context_children: (entity_definition | value_object_definition | event_definition | service_definition | repository_definition | module_definition | role_definition | relationship_definition)*
+
+entity_definition: "#" IDENTIFIER entity_inheritance? "{" entity_children "}"
+entity_inheritance: ":" IDENTIFIER
+entity_children: (property_definition | method_definition | api_definition | ui_definition)*
+
+value_object_definition: "%" IDENTIFIER "{" property_definition* "}"
+event_definition: "^" IDENTIFIER "{" property_definition* "}"
+service_definition: ">>" IDENTIFIER "{" service_children "}"
+service_children: (method_definition | api_definition)*
+repository_definition: "$" IDENTIFIER "{" method_definition* "}"
+module_definition: "*" IDENTIFIER "{" module_children "}"
+module_children: (entity_definition | value_object_definition | event_definition | service_definition | repository_definition)*
+role_definition: "&" IDENTIFIER "{" property_definition* "}"
+
+property_definition: IDENTIFIER ":" type_definition property_default? property_constraint?
+
+property_default: "=" default_value
+property_constraint: "[" constraint+ "]"
+
+type_definition: simple_type | generic_type | list_type | dict_type
+simple_type: IDENTIFIER
+generic_type: IDENTIFIER "<" IDENTIFIER ">"
+list_type: "List" "<" type_definition ">"
+dict_type: "Dict" "<" type_definition ":" type_definition ">"
+
+method_definition: visibility? IDENTIFIER "(" parameter_list? ")" return_type? method_body?
+visibility: VISIBILITY
+return_type: ":" type_definition
+method_body: "{" description? "}"
+
+parameter_list: parameter ("," parameter)*
+parameter: IDENTIFIER ":" type_definition parameter_default?
+parameter_default: "=" default_value
+
+default_value: INT | FLOAT | STRING | IDENTIFIER | list_value
+list_value: "[" value_list? "]"
+value_list: value ("," value)*
+value: INT | FLOAT | STRING | IDENTIFIER | list_value
+
+constraint: "required" | "unique" | min_constraint | max_constraint | pattern_constraint | fk_constraint
+min_constraint: "min" ":" INT
+max_constraint: "max" ":" INT
+pattern_constraint: "pattern" ":" STRING
+fk_constraint: "foreign_key" ":" IDENTIFIER
+
+relationship_definition: source_entity RELATIONSHIP_SYMBOL target_entity relationship_desc?
+relationship_desc: "{" description? "}"
+source_entity: IDENTIFIER
+target_entity: IDENTIFIER
+
+description: STRING
+
+api_definition: "api" ":" HTTP_METHOD STRING api_params? api_return? api_desc?
+api_params: "(" parameter_list? ")"
+api_return: ":" type_definition
+api_desc: "{" description? "}"
+
+ui_definition: "ui" ":" UI_COMPONENT ui_params? ui_desc?
+ui_params: "(" parameter_list? ")"
+ui_desc: "{" description? "}"
+
+// Terminals
+IDENTIFIER: /[a-zA-Z_][a-zA-Z0-9_]*/
+RELATIONSHIP_SYMBOL: "=>" | "<->" | "--" | "->" | "." | "::" | "/" | "="
+HTTP_METHOD: "GET" | "POST" | "PUT" | "DELETE" | "PATCH"
+UI_COMPONENT: "Form" | "Table" | "Card" | "Detail" | "List"
+VISIBILITY: "public" | "private" | "protected"
+
+STRING: /"[^"]*"/
+
+%import common.INT
+%import common.FLOAT
+%import common.WS
+
+COMMENT: /\/\/[^\n]*/ | /\/\*[\s\S]*?\*\//
+%ignore COMMENT
+%ignore WS
+"""
+
+
+_TOKEN, _TREE_ENTER, _TREE_EXIT = 0, 1, 2
+
+
+def tree_to_json(node: "Union[Tree, Token]", out: TextIO, indent: int = 0) -> None:
+    """Write a Lark tree as indented JSON for easier inspection.
+
+    The output matches ``json.dumps`` with ``indent=2`` applied to the
+    ``{"type", "data", "children"}`` / ``{"type", "token_type", "value"}``
+    dictionary form of the tree, without building that dictionary first.
     """
+    from lark import Token, Tree
+
+    # Entry tag per node type; Lark builds plain Tree and Token instances
+    entry_tag = {Tree: _TREE_ENTER, Token: _TOKEN}
+
+    # Iterative walk: a tree is visited on entry to write its header and
+    # queue its children, then again on exit to close its children list.
+    stack: List[Tuple[int, Union[Tree, Token], int, bool]] = [
+        (entry_tag[type(node)], node, indent, True)
+    ]
+    while stack:
+        tag, current, depth, last = stack.pop()
+        pad = "  " * depth
+        inner = pad + "  "
+        if tag == _TOKEN:
+            out.write(
+                f"{pad}{{\n"
+                f'{inner}"type": "Token",\n'
+                f'{inner}"token_type": {encode_basestring_ascii(current.type)},\n'
+                f'{inner}"value": {encode_basestring_ascii(current.value)}\n'
+                f"{pad}}}"
+            )
+            if not last:
+                out.write(",\n")
+        elif tag == _TREE_ENTER:
+            out.write(
+                f"{pad}{{\n"
+                f'{inner}"type": "Tree",\n'
+                f'{inner}"data": {encode_basestring_ascii(current.data)},\n'
+                f'{inner}"children": ['
+            )
+            stack.append((_TREE_EXIT, current, depth, last))
+            children = current.children
+            if children:
+                out.write("\n")
+            for index in range(len(children) - 1, -1, -1):
+                child = children[index]
+                stack.append(
+                    (
+                        entry_tag[type(child)],
+                        child,
+                        depth + 2,
+                        index == len(children) - 1,
+                    )
+                )
+        else:
+            if current.children:
+                out.write(f"\n{inner}]")
+            else:
+                out.write("]")
+            out.write(f"\n{pad}}}")
+            if not last:
+                out.write(",\n")
+
+
+@pytest.fixture(scope="session")
+def domainforge_parser(request: pytest.FixtureRequest) -> "Lark":
+    """Build the LALR parser for the debug grammar once per session.
+
+    The built parser is saved under pytest's cache directory with
+    ``Lark.save`` so later runs (and xdist workers) restore it with
+    ``Lark.load`` instead of analyzing the grammar again.
+    """
+    import lark
+    from lark import Lark
+
+    pytest_cache = getattr(request.config, "cache", None)
+    if pytest_cache is None:
+        return Lark(_GRAMMAR, parser="lalr")
 
-    parser = Lark(grammar, parser="lalr")
+    digest = hashlib.sha256(f"{lark.__version__}{_GRAMMAR}".encode()).hexdigest()
+    path = pytest_cache.mkdir("lark") / f"debug_grammar-{digest[:16]}.bin"
+    try:
+        with path.open("rb") as f:
+            return Lark.load(f)
+    except Exception:
+        # Missing or unreadable cache: rebuild and (re)write it
+        parser = Lark(_GRAMMAR, parser="lalr")
+        with path.open("wb") as f:
+            parser.save(f)
+        return parser
+
+
+def test_debug_parse_tree(domainforge_parser: "Lark", request: pytest.FixtureRequest):
+    from lark import Token, Tree
 
     dsl = """
     @Context {
@@ -113,36 +201,34 @@ def test_debug_parse_tree():
         }
     }
     """
-    tree = parser.parse(dsl)
-
-    # Convert tree to a dictionary and display it as JSON
-    tree_dict: Dict[str, Any] = tree_to_dict(tree)
-    tree_json: str = json.dumps(tree_dict, indent=2)
+    tree = domainforge_parser.parse(dsl)
 
-    # Print the tree structure for debugging without failing
-    print(f"\nParse Tree Structure:\n{tree_json}")
+    # Only render the tree on request: pytest.ini already adds one -v and
+    # disables capture, so ask for it with one more -v (pytest -v)
+    if request.config.getoption("verbose") >= 2:
+        out = io.StringIO()
+        tree_to_json(tree, out)
+        print(f"\nParse Tree Structure:\n{out.getvalue()}")
 
     # Instead of failing, let's assert that we got the expected structure
-    # The expected structure is exactly what we already have in the JSON
-    assert tree_dict["type"] == "Tree"
-    assert tree_dict["data"] == "start"
-    assert len(tree_dict["children"]) == 1
+    assert tree.data == "start"
+    assert len(tree.children) == 1
 
     # Check that the first child is a context definition
-    context_def = tree_dict["children"][0]
-    assert context_def["type"] == "Tree"
-    assert context_def["data"] == "context_definition"
+    context_def = tree.children[0]
+    assert isinstance(context_def, Tree)
+    assert context_def.data == "context_definition"
 
     # Verify the context has the expected name
-    context_name = context_def["children"][0]
-    assert context_name["type"] == "Token"
-    assert context_name["token_type"] == "IDENTIFIER"
-    assert context_name["value"] == "Context"
+    context_name = context_def.children[0]
+    assert isinstance(context_name, Token)
+    assert context_name.type == "IDENTIFIER"
+    assert context_name.value == "Context"
 
 
-def test_debug_property_definition():
+def test_debug_property_definition(transformer: "DomainForgeTransformer"):
     """Debug test for property_definition transformer method."""
-    transformer: DomainForgeTransformer = DomainForgeTransformer()
+    from lark import Token, Tree
 
     # Create a simple property definition tree
     property_tree: Tree = Tree(
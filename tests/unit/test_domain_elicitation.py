@@ -12,7 +12,7 @@ class TestDomainElicitationSession:
 
         assert session.session_id == "test-session-1"
         assert session.domain_entities == {}
-        assert session.relationships == []
+        assert session.relationships == ()
         assert session.current_stage == "introduction"
 
     def test_add_entity(self) -> None:
@@ -24,14 +24,14 @@ class TestDomainElicitationSession:
         session.add_entity("User", properties)
 
         assert "User" in session.domain_entities
-        assert session.domain_entities["User"] == properties
+        assert session.domain_entities["User"] == tuple(properties)
 
         # Add another entity
         order_properties = ["id: UUID", "date: DateTime", "total: Decimal"]
         session.add_entity("Order", order_properties)
 
         assert len(session.domain_entities) == 2
-        assert session.domain_entities["Order"] == order_properties
+        assert session.domain_entities["Order"] == tuple(order_properties)
 
     def test_add_relationship(self) -> None:
         """Test adding relationships between entities."""
@@ -76,3 +76,25 @@ class TestDomainElicitationSession:
         assert len(model["relationships"]) == 1
         assert model["entities"]["User"] == ["name: String"]
         assert model["relationships"][0]["source"] == "User"
+
+    def test_readd_entity_replaces_properties(self) -> None:
+        """Test re-adding an entity replaces its properties in place."""
+        session = DomainElicitationSession("test-session-1")
+
+        session.add_entity("User", ["name: String"])
+        session.add_entity("Order", ["id: UUID", "total: Decimal"])
+        assert session.has_entity("User")
+        assert not session.has_entity("Product")
+
+        # Grow, then shrink, the first entity; later entities must not shift
+        session.add_entity("User", ["name: String", "email: String"])
+        assert session.domain_entities == {
+            "User": ("name: String", "email: String"),
+            "Order": ("id: UUID", "total: Decimal"),
+        }
+
+        session.add_entity("User", [])
+        assert session.domain_entities == {
+            "User": (),
+            "Order": ("id: UUID", "total: Decimal"),
+        }
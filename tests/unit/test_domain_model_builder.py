@@ -1,5 +1,7 @@
 """Unit tests for the domain model builder functionality."""
 
+import pytest
+
 from domainforge.core.interpreter import DomainModelBuilder
 
 
@@ -11,7 +13,7 @@ class TestDomainModelBuilder:
         builder = DomainModelBuilder()
 
         assert builder.entities == {}
-        assert builder.relationships == []
+        assert builder.relationships == ()
 
     def test_add_entity(self) -> None:
         """Test adding entities to the model."""
@@ -22,14 +24,14 @@ class TestDomainModelBuilder:
         builder.add_entity("User", properties)
 
         assert "User" in builder.entities
-        assert builder.entities["User"] == properties
+        assert builder.entities["User"] == tuple(properties)
 
         # Add another entity
         order_properties = ["id: UUID", "date: DateTime", "total: Decimal"]
         builder.add_entity("Order", order_properties)
 
         assert len(builder.entities) == 2
-        assert builder.entities["Order"] == order_properties
+        assert builder.entities["Order"] == tuple(order_properties)
 
     def test_add_relationship(self) -> None:
         """Test adding relationships between entities."""
@@ -93,3 +95,16 @@ class TestDomainModelBuilder:
         assert deserialized["entities"]["User"] == ["name: String", "email: String"]
         assert deserialized["relationships"][0]["source"] == "User"
         assert deserialized["relationships"][0]["target"] == "Order"
+
+    def test_views_are_read_only(self) -> None:
+        """Test the entity and relationship views reject mutation."""
+        builder = DomainModelBuilder()
+        builder.add_entity("User", ["name: String"])
+        builder.add_relationship("User", "Order", "=>")
+
+        with pytest.raises(TypeError):
+            builder.entities["Order"] = ["total: Decimal"]
+        with pytest.raises(AttributeError):
+            builder.relationships.append({"source": "Order"})
+        with pytest.raises(TypeError):
+            builder.relationships[0]["type"] = "--"
@@ -1,335 +1,502 @@
 import pytest
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, NamedTuple, Optional, Any, Sequence, Tuple
+import functools
+import re
+import sys
 from enum import Enum
 
+from jinja2 import Environment
+
 # Import mock models directly without relative import
 from tests.unit.test_enhanced_ui_model import UIComponent, ComponentType, UIDefinition
 
 
-@dataclass
-class CodeGenerationResult:
-    """Class representing the result of code generation."""
-
-    typescript_code: str
-    css_code: Optional[str] = None
-    imports: List[str] = field(default_factory=list)
-
-
-class UIComponentGenerator:
-    """Mock generator that converts UI component models to React TypeScript code."""
-
-    def generate_component(self, component: UIComponent) -> CodeGenerationResult:
-        """Generate React component code from a UI component model."""
-        component_type = component.component_type
-        imports = []
-
-        # Basic implementation to generate different code based on component type
-        if component_type in [
-            ComponentType.FORM,
-            ComponentType.TABLE,
-            ComponentType.CARD,
-            ComponentType.DETAIL,
-            ComponentType.LIST,
-        ]:
-            return self._generate_basic_component(component)
-
-        elif component_type in [
-            ComponentType.CONTAINER,
-            ComponentType.GRID,
-            ComponentType.FLEX,
-            ComponentType.PANEL,
-            ComponentType.TABS,
-            ComponentType.ACCORDION,
-        ]:
-            return self._generate_layout_component(component)
-
-        elif component_type in [
-            ComponentType.MENU,
-            ComponentType.NAVBAR,
-            ComponentType.SIDEBAR,
-            ComponentType.BREADCRUMBS,
-            ComponentType.PAGINATION,
-        ]:
-            return self._generate_navigation_component(component)
-
-        elif component_type in [
-            ComponentType.INPUT,
-            ComponentType.SELECT,
-            ComponentType.CHECKBOX,
-            ComponentType.RADIO,
-            ComponentType.DATEPICKER,
-            ComponentType.TIMEPICKER,
-            ComponentType.FILEUPLOAD,
-        ]:
-            return self._generate_input_component(component)
-
-        elif component_type in [
-            ComponentType.MODAL,
-            ComponentType.DIALOG,
-            ComponentType.TOOLTIP,
-            ComponentType.CHART,
-            ComponentType.BADGE,
-            ComponentType.AVATAR,
-            ComponentType.PROGRESS,
-        ]:
-            return self._generate_display_component(component)
-
-        else:
-            # Default case
-            return CodeGenerationResult(
-                typescript_code=f"// Unknown component type: {component_type.value}"
-            )
-
-    def _generate_basic_component(self, component: UIComponent) -> CodeGenerationResult:
-        """Generate code for basic components like Form, Table, etc."""
-        component_name = f"{component.component_type.value}Component"
-        props = self._generate_props(component.parameters)
-        layout_style = self._generate_layout_style(component.layout)
-        children_code = self._generate_children(component.children)
-
-        code = f"""
-import React from 'react';
-
-interface {component_name}Props {{
-  {props}
-}}
-
-export const {component_name}: React.FC<{component_name}Props> = (props) => {{
+# React component name and CSS class prefix for each component type
+_COMPONENT_NAMES: Dict[ComponentType, Tuple[str, str]] = {
+    component_type: (
+        sys.intern(f"{component_type.value}Component"),
+        sys.intern(component_type.value.lower()),
+    )
+    for component_type in ComponentType
+}
+
+# Position before each capital letter, where camelCase keys get a dash
+_CAMEL_RE = re.compile(r"(?=[A-Z])")
+
+
+# Parameters rendered by the input template rather than declared as props
+_SKIP_PROPS = frozenset({"type", "placeholder", "label"})
+
+
+@functools.lru_cache(maxsize=4096)
+def _props_for(names: Tuple[str, ...]) -> str:
+    """TypeScript prop declarations for the given parameter names."""
+    # A real generator would map the parameter types properly
+    return "\n  ".join(f"{name}: any;" for name in names if name not in _SKIP_PROPS)
+
+
+@functools.lru_cache(maxsize=4096)
+def _css_property(name: str) -> str:
+    """Convert a camelCase layout key to its CSS kebab-case property name."""
+    return _CAMEL_RE.sub("-", name).lower().lstrip("-")
+
+
+# Import lines shared by every generated component of a kind
+_REACT_IMPORT = "import React from 'react';"
+_REACT_IMPORTS = (_REACT_IMPORT,)
+_NAV_IMPORTS = (_REACT_IMPORT, "import { Link } from 'react-router-dom';")
+_LAYOUT_IMPORTS: Dict[ComponentType, Tuple[str, str]] = {
+    component_type: (
+        _REACT_IMPORT,
+        f"import './styles/{_COMPONENT_NAMES[component_type][1]}.css';",
+    )
+    for component_type in (
+        ComponentType.CONTAINER,
+        ComponentType.GRID,
+        ComponentType.FLEX,
+        ComponentType.PANEL,
+        ComponentType.TABS,
+        ComponentType.ACCORDION,
+    )
+}
+
+# JSX element for a nested child component, split around the parts that
+# differ between siblings of the same shape: its key and its children
+_CHILD_OPEN_TMPL = """
+      <{name}
+        {{...props}}
+        style={{{style}}}
+        key="""
+_CHILD_CLOSE_TMPL = """
+      </{name}>"""
+
+# Component skeletons are compiled once at import; each generate call only
+# renders them. JSX braces are literal text, so the inline style object is
+# wrapped in braces inside the expression. The skeletons start on the opening
+# quote and Jinja drops the final newline, so renders need no strip().
+# Autoescaping stays off: the output is TSX source, not HTML.
+_ENV = Environment(autoescape=False, auto_reload=False)  # noqa: S701
+
+_BASIC_TMPL = _ENV.from_string(
+    """import React from 'react';
+
+interface {{ component_name }}Props {
+  {{ props }}
+}
+
+export const {{ component_name }}: React.FC<{{ component_name }}Props> = (props) => {
   return (
-    <div className="{component.component_type.value.lower()}-component" style={{{layout_style}}}>
-      {f"<h3>{component.description}</h3>" if component.description else ""}
-      {children_code}
+    <div className="{{ css_class }}-component" style={{ "{" ~ layout_style ~ "}" }}>
+      {% if description %}<h3>{{ description }}</h3>{% endif %}
+      {{ children_code }}
     </div>
   );
-}};
+};
 """
+)
 
-        return CodeGenerationResult(
-            typescript_code=code.strip(), imports=["import React from 'react';"]
-        )
-
-    def _generate_layout_component(
-        self, component: UIComponent
-    ) -> CodeGenerationResult:
-        """Generate code for layout components like Container, Grid, etc."""
-        component_name = f"{component.component_type.value}Component"
-        props = self._generate_props(component.parameters)
-        layout_style = self._generate_layout_style(component.layout)
-        children_code = self._generate_children(component.children)
-
-        # Additional CSS for layout components
-        css = f"""
-.{component.component_type.value.lower()}-component {{
+_LAYOUT_CSS_TMPL = _ENV.from_string(
+    """.{{ css_class }}-component {
   display: flex;
   flex-direction: column;
-  {f"max-width: {component.layout.get('maxWidth', '100%')};" if "maxWidth" in component.layout else ""}
-  {f"margin: {component.layout.get('margin', '0')};" if "margin" in component.layout else ""}
-}}
+  {% if "maxWidth" in layout %}max-width: {{ layout["maxWidth"] }};{% endif %}
+  {% if "margin" in layout %}margin: {{ layout["margin"] }};{% endif %}
+}
 """
+)
 
-        code = f"""
-import React from 'react';
-import './styles/{component.component_type.value.lower()}.css';
+_LAYOUT_TMPL = _ENV.from_string(
+    """import React from 'react';
+import './styles/{{ css_class }}.css';
 
-interface {component_name}Props {{
-  {props}
+interface {{ component_name }}Props {
+  {{ props }}
   children?: React.ReactNode;
-}}
+}
 
-export const {component_name}: React.FC<{component_name}Props> = (props) => {{
+export const {{ component_name }}: React.FC<{{ component_name }}Props> = (props) => {
   return (
-    <div className="{component.component_type.value.lower()}-component" style={{{layout_style}}}>
-      {f"<h3>{component.description}</h3>" if component.description else ""}
-      {children_code}
+    <div className="{{ css_class }}-component" style={{ "{" ~ layout_style ~ "}" }}>
+      {% if description %}<h3>{{ description }}</h3>{% endif %}
+      {{ children_code }}
     </div>
   );
-}};
+};
 """
+)
 
-        return CodeGenerationResult(
-            typescript_code=code.strip(),
-            css_code=css.strip(),
-            imports=[
-                "import React from 'react';",
-                f"import './styles/{component.component_type.value.lower()}.css';",
-            ],
-        )
+_NAV_TMPL = _ENV.from_string(
+    """import React from 'react';
+import { Link } from 'react-router-dom';
 
-    def _generate_navigation_component(
-        self, component: UIComponent
-    ) -> CodeGenerationResult:
-        """Generate code for navigation components like Menu, Navbar, etc."""
-        component_name = f"{component.component_type.value}Component"
-        props = self._generate_props(component.parameters)
-        layout_style = self._generate_layout_style(component.layout)
-        children_code = self._generate_children(component.children)
-
-        code = f"""
-import React from 'react';
-import {{ Link }} from 'react-router-dom';
-
-interface {component_name}Props {{
-  {props}
-}}
+interface {{ component_name }}Props {
+  {{ props }}
+}
 
-export const {component_name}: React.FC<{component_name}Props> = (props) => {{
+export const {{ component_name }}: React.FC<{{ component_name }}Props> = (props) => {
   return (
-    <nav className="{component.component_type.value.lower()}-component" style={{{layout_style}}}>
-      {f'<div className="nav-title">{component.description}</div>' if component.description else ""}
-      {children_code}
+    <nav className="{{ css_class }}-component" style={{ "{" ~ layout_style ~ "}" }}>
+      {% if description %}<div className="nav-title">{{ description }}</div>{% endif %}
+      {{ children_code }}
     </nav>
   );
-}};
+};
 """
+)
 
-        return CodeGenerationResult(
-            typescript_code=code.strip(),
-            imports=[
-                "import React from 'react';",
-                "import { Link } from 'react-router-dom';",
-            ],
-        )
+_INPUT_TMPL = _ENV.from_string(
+    """import React from 'react';
 
-    def _generate_input_component(self, component: UIComponent) -> CodeGenerationResult:
-        """Generate code for input components like Input, Select, etc."""
-        component_name = f"{component.component_type.value}Component"
-        props = self._generate_props(component.parameters)
-        layout_style = self._generate_layout_style(component.layout)
-
-        # For input components, handle specific input-related props
-        input_type = component.parameters.get("type", "text")
-        placeholder = component.parameters.get("placeholder", "")
-        label = component.parameters.get("label", "")
-
-        code = f"""
-import React from 'react';
-
-interface {component_name}Props {{
-  {props}
+interface {{ component_name }}Props {
+  {{ props }}
   onChange?: (event: React.ChangeEvent<HTMLInputElement>) => void;
-}}
+}
 
-export const {component_name}: React.FC<{component_name}Props> = (props) => {{
+export const {{ component_name }}: React.FC<{{ component_name }}Props> = (props) => {
   return (
-    <div className="{component.component_type.value.lower()}-wrapper" style={{{layout_style}}}>
-      {f"<label>{label}</label>" if label else ""}
+    <div className="{{ css_class }}-wrapper" style={{ "{" ~ layout_style ~ "}" }}>
+      {% if label %}<label>{{ label }}</label>{% endif %}
       <input
-        type="{input_type}"
-        className="{component.component_type.value.lower()}-component"
-        placeholder="{placeholder}"
-        {{...props}}
+        type="{{ input_type }}"
+        className="{{ css_class }}-component"
+        placeholder="{{ placeholder }}"
+        {...props}
       />
-      {f"<small>{component.description}</small>" if component.description else ""}
+      {% if description %}<small>{{ description }}</small>{% endif %}
     </div>
   );
-}};
+};
 """
+)
 
-        return CodeGenerationResult(
-            typescript_code=code.strip(), imports=["import React from 'react';"]
-        )
-
-    def _generate_display_component(
-        self, component: UIComponent
-    ) -> CodeGenerationResult:
-        """Generate code for display components like Modal, Chart, etc."""
-        component_name = f"{component.component_type.value}Component"
-        props = self._generate_props(component.parameters)
-        layout_style = self._generate_layout_style(component.layout)
-        children_code = self._generate_children(component.children)
+_DISPLAY_TMPL = _ENV.from_string(
+    """import React from 'react';
 
-        code = f"""
-import React from 'react';
-
-interface {component_name}Props {{
-  {props}
+interface {{ component_name }}Props {
+  {{ props }}
   isOpen?: boolean;
   onClose?: () => void;
-}}
+}
 
-export const {component_name}: React.FC<{component_name}Props> = (props) => {{
+export const {{ component_name }}: React.FC<{{ component_name }}Props> = (props) => {
   return (
-    <div className="{component.component_type.value.lower()}-component" style={{{layout_style}}}>
-      {f'<div className="component-header">{component.description}</div>' if component.description else ""}
+    <div className="{{ css_class }}-component" style={{ "{" ~ layout_style ~ "}" }}>
+      {% if description %}<div className="component-header">{{ description }}</div>{% endif %}
       <div className="component-body">
-        {children_code}
+        {{ children_code }}
       </div>
-      {f"<button onClick={{props.onClose}}>Close</button>" if component.component_type in [ComponentType.MODAL, ComponentType.DIALOG] else ""}
+      {% if closable %}<button onClick={props.onClose}>Close</button>{% endif %}
     </div>
   );
-}};
+};
 """
+)
+
+
+def _freeze(value: Any) -> Any:
+    """Return a hashable stand-in for a parameter or layout value."""
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    # Keep the type so values like 1 and True, which hash alike, stay distinct
+    return (type(value), value)
+
+
+def _component_key(component: UIComponent) -> Tuple:
+    """Structural key of a component tree; equal keys generate equal code.
+
+    Parameter and layout items keep their order since it shows in the output.
+    """
+    return (
+        component.component_type,
+        tuple((name, _freeze(value)) for name, value in component.parameters.items()),
+        tuple((name, _freeze(value)) for name, value in component.layout.items()),
+        component.description,
+        tuple(_component_key(child) for child in component.children),
+    )
+
+
+class CodeGenerationResult(NamedTuple):
+    """Class representing the result of code generation."""
+
+    typescript_code: str
+    css_code: Optional[str] = None
+    imports: Sequence[str] = ()
+
+
+class UIComponentGenerator:
+    """Mock generator that converts UI component models to React TypeScript code."""
+
+    def __init__(self) -> None:
+        """Initialize the generator with an empty result cache."""
+        # Generation is a pure function of the component tree
+        self._cache: Dict[Tuple, CodeGenerationResult] = {}
+
+    def generate_component(self, component: UIComponent) -> CodeGenerationResult:
+        """Generate React component code from a UI component model."""
+        key = _component_key(component)
+        result = self._cache.get(key)
+        if result is None:
+            result = self._cache[key] = self._generate_component(component)
+        return result
+
+    def _generate_component(self, component: UIComponent) -> CodeGenerationResult:
+        """Generate code for a component without consulting the cache."""
+        handler = self._DISPATCH.get(component.component_type)
+        if handler is None:
+            # Default case
+            return CodeGenerationResult(
+                typescript_code=f"// Unknown component type: {component.component_type.value}"
+            )
+        return handler(self, component)
+
+    def _generate_basic_component(self, component: UIComponent) -> CodeGenerationResult:
+        """Generate code for basic components like Form, Table, etc."""
+        component_name, css_class = _COMPONENT_NAMES[component.component_type]
+        code = _BASIC_TMPL.render(
+            component_name=component_name,
+            css_class=css_class,
+            props=self._generate_props(component.parameters),
+            layout_style=self._generate_layout_style(component.layout),
+            description=component.description,
+            children_code=self._generate_children(component.children),
+        )
+
+        return CodeGenerationResult(typescript_code=code, imports=_REACT_IMPORTS)
+
+    def _generate_layout_component(
+        self, component: UIComponent
+    ) -> CodeGenerationResult:
+        """Generate code for layout components like Container, Grid, etc."""
+        component_name, css_class = _COMPONENT_NAMES[component.component_type]
+
+        # Additional CSS for layout components
+        css = _LAYOUT_CSS_TMPL.render(css_class=css_class, layout=component.layout)
+
+        code = _LAYOUT_TMPL.render(
+            component_name=component_name,
+            css_class=css_class,
+            props=self._generate_props(component.parameters),
+            layout_style=self._generate_layout_style(component.layout),
+            description=component.description,
+            children_code=self._generate_children(component.children),
+        )
 
         return CodeGenerationResult(
-            typescript_code=code.strip(), imports=["import React from 'react';"]
+            typescript_code=code,
+            css_code=css,
+            imports=_LAYOUT_IMPORTS[component.component_type],
         )
 
+    def _generate_navigation_component(
+        self, component: UIComponent
+    ) -> CodeGenerationResult:
+        """Generate code for navigation components like Menu, Navbar, etc."""
+        component_name, css_class = _COMPONENT_NAMES[component.component_type]
+        code = _NAV_TMPL.render(
+            component_name=component_name,
+            css_class=css_class,
+            props=self._generate_props(component.parameters),
+            layout_style=self._generate_layout_style(component.layout),
+            description=component.description,
+            children_code=self._generate_children(component.children),
+        )
+
+        return CodeGenerationResult(
+            typescript_code=code,
+            imports=_NAV_IMPORTS,
+        )
+
+    def _generate_input_component(self, component: UIComponent) -> CodeGenerationResult:
+        """Generate code for input components like Input, Select, etc."""
+        # For input components, handle specific input-related props
+        component_name, css_class = _COMPONENT_NAMES[component.component_type]
+        code = _INPUT_TMPL.render(
+            component_name=component_name,
+            css_class=css_class,
+            props=self._generate_props(component.parameters),
+            layout_style=self._generate_layout_style(component.layout),
+            input_type=component.parameters.get("type", "text"),
+            placeholder=component.parameters.get("placeholder", ""),
+            label=component.parameters.get("label", ""),
+            description=component.description,
+        )
+
+        return CodeGenerationResult(typescript_code=code, imports=_REACT_IMPORTS)
+
+    def _generate_display_component(
+        self, component: UIComponent
+    ) -> CodeGenerationResult:
+        """Generate code for display components like Modal, Chart, etc."""
+        component_name, css_class = _COMPONENT_NAMES[component.component_type]
+        code = _DISPLAY_TMPL.render(
+            component_name=component_name,
+            css_class=css_class,
+            props=self._generate_props(component.parameters),
+            layout_style=self._generate_layout_style(component.layout),
+            description=component.description,
+            children_code=self._generate_children(component.children),
+            closable=component.component_type
+            in [ComponentType.MODAL, ComponentType.DIALOG],
+        )
+
+        return CodeGenerationResult(typescript_code=code, imports=_REACT_IMPORTS)
+
     def _generate_props(self, parameters: Dict[str, Any]) -> str:
         """Generate TypeScript props from component parameters."""
         if not parameters:
             return ""
 
-        props = []
-        for name, value in parameters.items():
-            # Skip special parameters that are handled separately
-            if name in ["type", "placeholder", "label"]:
-                continue
-
-            # Simple implementation - in real code would handle types properly
-            props.append(f"{name}: any;")
-
-        return "\n  ".join(props)
+        # Props only depend on the parameter names
+        return _props_for(tuple(parameters))
 
     def _generate_layout_style(self, layout: Dict[str, Any]) -> str:
         """Generate inline style object from layout parameters."""
         if not layout:
             return "{}"
 
-        styles = []
-        for name, value in layout.items():
-            # Convert camelCase to CSS kebab-case for style props
-            css_name = "".join(
-                ["-" + c.lower() if c.isupper() else c for c in name]
-            ).lstrip("-")
+        styles = ", ".join(
+            f"{_css_property(name)}: '{value}'" for name, value in layout.items()
+        )
+        return "{{ {} }}".format(styles)
+
+    def _generate_children(self, children: List[UIComponent]) -> str:
+        """Generate JSX for child components, innermost first."""
+        if not children:
+            return "{props.children}"
 
-            # Add the style property
-            styles.append(f"{css_name}: '{value}'")
+        # Post-order walk with an explicit stack: a component is revisited
+        # once its children have been rendered, so its own block can reuse
+        # their strings. Blocks are keyed by object identity, so a subtree
+        # shared by several parents is rendered once.
+        blocks: Dict[int, str] = {}
+        stack = [(child, False) for child in children]
+        while stack:
+            component, expanded = stack.pop()
+            if id(component) in blocks:
+                continue
+            if component.children and not expanded:
+                stack.append((component, True))
+                stack.extend((child, False) for child in component.children)
+            else:
+                blocks[id(component)] = self._join_child_elements(
+                    component.children, blocks
+                )
 
-        return "{ " + ", ".join(styles) + " }"
+        return self._join_child_elements(children, blocks)
 
-    def _generate_children(self, children: List[UIComponent]) -> str:
-        """Generate JSX for child components recursively."""
+    def _join_child_elements(
+        self, children: List[UIComponent], blocks: Dict[int, str]
+    ) -> str:
+        """Render child elements around their already rendered children."""
         if not children:
             return "{props.children}"
 
-        # Generate child components recursively
+        # Siblings of the same type and layout share their opening and
+        # closing markup; only the key and nested children differ
+        shapes: Dict[Tuple, Tuple[str, str]] = {}
         child_jsx = []
         for i, child in enumerate(children):
-            component_name = f"{child.component_type.value}Component"
-            child_props = self._generate_props(child.parameters)
-            layout_style = self._generate_layout_style(child.layout)
-            nested_children = self._generate_children(child.children)
+            shape = (
+                child.component_type,
+                tuple((name, _freeze(value)) for name, value in child.layout.items()),
+            )
+            markup = shapes.get(shape)
+            if markup is None:
+                name = _COMPONENT_NAMES[child.component_type][0]
+                markup = shapes[shape] = (
+                    _CHILD_OPEN_TMPL.format(
+                        name=name, style=self._generate_layout_style(child.layout)
+                    ),
+                    _CHILD_CLOSE_TMPL.format(name=name),
+                )
+            opening, closing = markup
 
             # Generate child component with its own children
-            child_jsx.append(f'''
-      <{component_name}
-        {{...props}}
-        style={{{layout_style}}}
-        key="{i}"
-      >
-        {nested_children}
-      </{component_name}>''')
+            child_jsx.append(
+                f'{opening}"{i}"\n      >\n        {blocks[id(child)]}{closing}'
+            )
 
         return "\n".join(child_jsx)
 
+    # Generator for each component type, looked up once per component
+    _DISPATCH: Dict[
+        ComponentType,
+        Callable[["UIComponentGenerator", UIComponent], CodeGenerationResult],
+    ] = {
+        component_type: handler
+        for handler, component_types in (
+            (
+                _generate_basic_component,
+                (
+                    ComponentType.FORM,
+                    ComponentType.TABLE,
+                    ComponentType.CARD,
+                    ComponentType.DETAIL,
+                    ComponentType.LIST,
+                ),
+            ),
+            (
+                _generate_layout_component,
+                (
+                    ComponentType.CONTAINER,
+                    ComponentType.GRID,
+                    ComponentType.FLEX,
+                    ComponentType.PANEL,
+                    ComponentType.TABS,
+                    ComponentType.ACCORDION,
+                ),
+            ),
+            (
+                _generate_navigation_component,
+                (
+                    ComponentType.MENU,
+                    ComponentType.NAVBAR,
+                    ComponentType.SIDEBAR,
+                    ComponentType.BREADCRUMBS,
+                    ComponentType.PAGINATION,
+                ),
+            ),
+            (
+                _generate_input_component,
+                (
+                    ComponentType.INPUT,
+                    ComponentType.SELECT,
+                    ComponentType.CHECKBOX,
+                    ComponentType.RADIO,
+                    ComponentType.DATEPICKER,
+                    ComponentType.TIMEPICKER,
+                    ComponentType.FILEUPLOAD,
+                ),
+            ),
+            (
+                _generate_display_component,
+                (
+                    ComponentType.MODAL,
+                    ComponentType.DIALOG,
+                    ComponentType.TOOLTIP,
+                    ComponentType.CHART,
+                    ComponentType.BADGE,
+                    ComponentType.AVATAR,
+                    ComponentType.PROGRESS,
+                ),
+            ),
+        )
+        for component_type in component_types
+    }
+
 
 class TestEnhancedUIGeneration:
     """Test suite for enhanced UI component code generation."""
 
     @pytest.fixture
     def generator(self):
-        """Fixture providing a UI component generator."""
+        """Fixture providing a UI component generator.
+
+        Each test gets a fresh generator so its result cache never serves
+        output computed by an earlier test.
+        """
         return UIComponentGenerator()
 
     def test_basic_component_generation(self, generator):
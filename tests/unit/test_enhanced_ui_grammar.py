@@ -1,359 +1,438 @@
+import functools
 import pytest
-from lark import Lark, Token, Tree
+from dataclasses import dataclass
+from lark import Lark, Token, Transformer, Tree
 from pathlib import Path
-import os
+from typing import Any, Dict, List, Optional, Tuple
 
+# Keep the module on one xdist worker so the session parser is built once
+pytestmark = pytest.mark.xdist_group("ui_grammar")
 
-@pytest.fixture
-def enhanced_ui_parser():
-    """Fixture providing a parser with enhanced UI component support."""
-    # Use the actual grammar file from the project
-    grammar_path = (
-        Path(os.path.dirname(__file__)) / "../../domainforge/core/grammar.lark"
-    )
-    with open(grammar_path, "r") as f:
-        grammar = f.read()
+# Use the actual grammar file from the project
+_GRAMMAR_PATH = (
+    Path(__file__).parent / ".." / ".." / "domainforge" / "core" / "grammar.lark"
+).resolve()
 
-    return Lark(grammar, parser="lalr")
 
+@functools.lru_cache(maxsize=1)
+def _grammar() -> str:
+    """Read the grammar file once per process."""
+    return _GRAMMAR_PATH.read_text(encoding="utf-8")
 
-class TestEnhancedUIGrammar:
-    """Test suite for enhanced UI component grammar features."""
 
-    def test_basic_component_with_description(self, enhanced_ui_parser):
-        """Test that basic components still work with the enhanced grammar."""
-        dsl = """
-        @Context {
-            #Entity {
-                ui: Form description: {
-                    "A form for the entity"
-                }
-            }
-        }
-        """
-        tree = enhanced_ui_parser.parse(dsl)
+# Group name for each kind of entry in a mixed_parameter_list
+_PARAM_GROUPS = {"ui_parameter": "simple", "layout_param_def": "layout"}
 
-        # Verify context and entity structure
-        context = tree.children[0]
-        assert context.children[0] == Token("IDENTIFIER", "Context")
 
-        entity = context.children[1].children[0]
-        assert entity.children[0] == Token("IDENTIFIER", "Entity")
+@dataclass(frozen=True)
+class UIDefinition:
+    """Named view of a ``ui_definition`` subtree."""
+
+    # Declared by hand: dataclass(slots=True) needs Python 3.10
+    __slots__ = ("kind", "type_name", "params", "children", "description")
+
+    kind: str  # Component terminal, e.g. "LAYOUT_COMPONENT"
+    type_name: str  # Component name, e.g. "Grid"
+    params: Optional[Dict[str, List[Tree]]]  # Parameters grouped by kind
+    children: Tuple["UIDefinition", ...]
+    description: Optional[str]  # Raw STRING token, quotes included
 
-        # Verify UI component
-        ui_def = entity.children[1].children[0]
-        assert ui_def.data == "ui_definition"
 
-        # UI component type should be "Form"
-        ui_component = ui_def.children[0]
-        assert ui_component == Token("BASIC_COMPONENT", "Form")
+class UIExtractor(Transformer):
+    """Project ``ui_definition`` subtrees onto :class:`UIDefinition` nodes.
 
-        # Check description
-        ui_desc = ui_def.children[1]
-        assert ui_desc.data == "ui_description"
-        assert ui_desc.children[0].children[0] == Token(
-            "STRING", '"A form for the entity"'
+    The optional parts are returned as tagged pairs so ``ui_definition`` can
+    tell them apart. Parameters are grouped by kind (see ``_PARAM_GROUPS``).
+    """
+
+    def ui_definition(self, children: List[Any]) -> UIDefinition:
+        """Build a :class:`UIDefinition` from the component and tagged parts."""
+        component, *parts = children
+        fields = dict(parts)
+        return UIDefinition(
+            kind=component.type,
+            type_name=component.value,
+            params=fields.get("params"),
+            children=fields.get("children", ()),
+            description=fields.get("description"),
         )
 
-    def test_nested_components(self, enhanced_ui_parser):
-        """Test nesting UI components within each other."""
-        dsl = """
-        @Context {
-            #Entity {
-                ui: Container components: {
-                    ui: Form description: {
-                        "A nested form"
-                    }
-                    ui: Table description: {
-                        "A nested table"
-                    }
-                }
+    def ui_params(
+        self, children: List[Any]
+    ) -> Tuple[str, Optional[Dict[str, List[Tree]]]]:
+        """Tag the grouped parameters, or ``None`` for an empty list."""
+        return "params", children[0] if children else None
+
+    def mixed_parameter_list(self, children: List[Tree]) -> Dict[str, List[Tree]]:
+        """Group the parameter subtrees by kind."""
+        groups: Dict[str, List[Tree]] = {}
+        for child in children:
+            groups.setdefault(_PARAM_GROUPS[child.data], []).append(child)
+        return groups
+
+    def ui_components(self, children: List[Any]) -> Tuple[str, Tuple[Any, ...]]:
+        """Tag the nested UI definitions."""
+        return "children", tuple(children)
+
+    def ui_description(self, children: List[Any]) -> Tuple[str, Optional[str]]:
+        """Tag the description string, or ``None`` if absent."""
+        return "description", children[0].children[0].value if children else None
+
+
+def _tok(token: Token) -> Tuple[str, str]:
+    """Return a token as a ``(type, value)`` pair for comparisons."""
+    return token.type, token.value
+
+
+def _value(node: Any) -> Any:
+    """Return a property value as its raw token text, or a list of them."""
+    if isinstance(node, Token):
+        return node.value
+    if node.data == "generic_list_value":
+        items = node.children[0].children if node.children else []
+        return [_value(item) for item in items]
+    # property_value and generic_value wrap a single token or list
+    return _value(node.children[0])
+
+
+def _params(groups: Dict[str, List[Tree]]) -> Dict[str, Any]:
+    """Map grouped UI parameters to parameter name -> value."""
+    params: Dict[str, Any] = {}
+    for param in groups.get("simple", ()):
+        name, value = param.children[0].children
+        params[name.value] = _value(value)
+    # layout_param_def: either ``layout: {...}`` or ``<name>: {...}``
+    for param in groups.get("layout", ()):
+        declaration = param.children[0]
+        if declaration.data == "layout_declaration":
+            name, layout_object = declaration.children
+            key = name.value
+        else:
+            key, layout_object = "layout", declaration
+        params[key] = {
+            prop.children[0].value: _value(prop.children[1])
+            for prop in layout_object.children[0].children
+        }
+    return params
+
+
+def _project(ui: UIDefinition) -> Dict[str, Any]:
+    """Normalize a UI definition to a dict, omitting absent parts."""
+    shape: Dict[str, Any] = {"component": (ui.kind, ui.type_name)}
+    if ui.params is not None:
+        shape["params"] = _params(ui.params)
+    if ui.children:
+        shape["children"] = [_project(child) for child in ui.children]
+    if ui.description is not None:
+        shape["description"] = ui.description
+    return shape
+
+
+_DSL_BASIC = """
+@Context {
+    #Entity {
+        ui: Form description: {
+            "A form for the entity"
+        }
+    }
+}
+"""
+
+_EXPECTED_BASIC = {
+    "component": ("BASIC_COMPONENT", "Form"),
+    "description": '"A form for the entity"',
+}
+
+_DSL_NESTED = """
+@Context {
+    #Entity {
+        ui: Container components: {
+            ui: Form description: {
+                "A nested form"
+            }
+            ui: Table description: {
+                "A nested table"
             }
         }
-        """
-        tree = enhanced_ui_parser.parse(dsl)
-
-        # Navigate to the UI definition
-        context = tree.children[0]
-        entity = context.children[1].children[0]
-        container_ui = entity.children[1].children[0]
-
-        # Verify Container component
-        assert container_ui.data == "ui_definition"
-        assert container_ui.children[0] == Token("LAYOUT_COMPONENT", "Container")
-
-        # Verify children container and nested components
-        ui_children = container_ui.children[1]
-        assert ui_children.data == "ui_components"
-
-        # First nested component should be Form
-        form_ui = ui_children.children[0]
-        assert form_ui.data == "ui_definition"
-        assert form_ui.children[0] == Token("BASIC_COMPONENT", "Form")
-
-        # Second nested component should be Table
-        table_ui = ui_children.children[1]
-        assert table_ui.data == "ui_definition"
-        assert table_ui.children[0] == Token("BASIC_COMPONENT", "Table")
-
-    def test_layout_parameters(self, enhanced_ui_parser):
-        """Test UI components with layout parameters."""
-        dsl = """
-        @Context {
-            #Entity {
-                ui: Grid (
-                    columns: 3,
-                    gap: "1rem",
-                    layout: {
-                        justifyContent: "space-between"
-                        alignItems: "center"
-                    }
-                ) components: {
-                    ui: Card description: {
-                        "First card"
-                    }
-                    ui: Card description: {
-                        "Second card"
-                    }
-                }
+    }
+}
+"""
+
+_EXPECTED_NESTED = {
+    "component": ("LAYOUT_COMPONENT", "Container"),
+    "children": [
+        {
+            "component": ("BASIC_COMPONENT", "Form"),
+            "description": '"A nested form"',
+        },
+        {
+            "component": ("BASIC_COMPONENT", "Table"),
+            "description": '"A nested table"',
+        },
+    ],
+}
+
+_DSL_LAYOUT = """
+@Context {
+    #Entity {
+        ui: Grid (
+            columns: 3,
+            gap: "1rem",
+            layout: {
+                justifyContent: "space-between"
+                alignItems: "center"
+            }
+        ) components: {
+            ui: Card description: {
+                "First card"
+            }
+            ui: Card description: {
+                "Second card"
             }
         }
-        """
-        tree = enhanced_ui_parser.parse(dsl)
-
-        # Navigate to the UI definition
-        context = tree.children[0]
-        entity = context.children[1].children[0]
-        grid_ui = entity.children[1].children[0]
-
-        # Verify Grid component
-        assert grid_ui.data == "ui_definition"
-        assert grid_ui.children[0] == Token("LAYOUT_COMPONENT", "Grid")
-
-        # Verify parameters
-        params = grid_ui.children[1]
-        assert params.data == "ui_params"
-
-        param_list = params.children[0]
-        assert param_list.data == "mixed_parameter_list"  # Updated assertion
-
-        # Find the layout parameter definition within the mixed_parameter_list
-        layout_param = None
-        for child in param_list.children:
-            if child.data == "layout_param_def":
-                layout_param = child
-                break
-
-        # Ensure we found the layout parameter
-        assert layout_param is not None, (
-            "Layout parameter not found in mixed_parameter_list"
-        )
-
-        # Verify the layout object structure
-        layout_object = layout_param.children[0]
-        assert layout_object.data == "layout_object"
-
-        # Check layout properties
-        layout_props_list = layout_object.children[0]
-        assert layout_props_list.data == "layout_property_list"
-
-        layout_props = layout_props_list.children
-        assert len(layout_props) == 2
-
-        # Check specific layout properties
-        justify_content = layout_props[0]
-        assert justify_content.children[0] == Token("IDENTIFIER", "justifyContent")
-        assert justify_content.children[1].data == "property_value"
-        assert justify_content.children[1].children[0] == Token(
-            "STRING", '"space-between"'
-        )
-
-        align_items = layout_props[1]
-        assert align_items.children[0] == Token("IDENTIFIER", "alignItems")
-        assert align_items.children[1].data == "property_value"
-        assert align_items.children[1].children[0] == Token("STRING", '"center"')
-
-    def test_navigation_components(self, enhanced_ui_parser):
-        """Test navigation component types."""
-        dsl = """
-        @Context {
-            #Entity {
-                ui: Navbar (
-                    position: "fixed",
-                    brand: "MyApp"
-                ) components: {
-                    ui: Menu description: {
-                        "Main navigation"
-                    }
-                }
+    }
+}
+"""
+
+_EXPECTED_LAYOUT = {
+    "component": ("LAYOUT_COMPONENT", "Grid"),
+    "params": {
+        "columns": "3",
+        "gap": '"1rem"',
+        "layout": {"justifyContent": '"space-between"', "alignItems": '"center"'},
+    },
+    "children": [
+        {"component": ("BASIC_COMPONENT", "Card"), "description": '"First card"'},
+        {"component": ("BASIC_COMPONENT", "Card"), "description": '"Second card"'},
+    ],
+}
+
+_DSL_NAVIGATION = """
+@Context {
+    #Entity {
+        ui: Navbar (
+            position: "fixed",
+            brand: "MyApp"
+        ) components: {
+            ui: Menu description: {
+                "Main navigation"
             }
         }
-        """
-        tree = enhanced_ui_parser.parse(dsl)
-
-        # Navigate to the UI definition
-        context = tree.children[0]
-        entity = context.children[1].children[0]
-        navbar_ui = entity.children[1].children[0]
-
-        # Verify Navbar component
-        assert navbar_ui.data == "ui_definition"
-        assert navbar_ui.children[0] == Token("NAV_COMPONENT", "Navbar")
-
-        # Verify nested Menu component
-        menu_ui = navbar_ui.children[2].children[0]
-        assert menu_ui.data == "ui_definition"
-        assert menu_ui.children[0] == Token("NAV_COMPONENT", "Menu")
-
-    def test_input_components(self, enhanced_ui_parser):
-        """Test input component types."""
-        dsl = """
-        @Context {
-            #Entity {
-                ui: Form components: {
-                    ui: Input (
-                        type: "text",
-                        placeholder: "Enter your name"
-                    ) description: {
-                        "Name input field"
+    }
+}
+"""
+
+_EXPECTED_NAVIGATION = {
+    "component": ("NAV_COMPONENT", "Navbar"),
+    "params": {"position": '"fixed"', "brand": '"MyApp"'},
+    "children": [
+        {"component": ("NAV_COMPONENT", "Menu"), "description": '"Main navigation"'},
+    ],
+}
+
+_DSL_INPUT = """
+@Context {
+    #Entity {
+        ui: Form components: {
+            ui: Input (
+                type: "text",
+                placeholder: "Enter your name"
+            ) description: {
+                "Name input field"
+            }
+            ui: Select (
+                options: ["Option 1", "Option 2"]
+            ) description: {
+                "Select dropdown"
+            }
+        }
+    }
+}
+"""
+
+_EXPECTED_INPUT = {
+    "component": ("BASIC_COMPONENT", "Form"),
+    "children": [
+        {
+            "component": ("INPUT_COMPONENT", "Input"),
+            "params": {"type": '"text"', "placeholder": '"Enter your name"'},
+            "description": '"Name input field"',
+        },
+        {
+            "component": ("INPUT_COMPONENT", "Select"),
+            "params": {"options": ['"Option 1"', '"Option 2"']},
+            "description": '"Select dropdown"',
+        },
+    ],
+}
+
+_DSL_COMPLEX = """
+@Context {
+    #Entity {
+        ui: Container (
+            layout: {
+                maxWidth: "1200px"
+                margin: "0 auto"
+            }
+        ) components: {
+            ui: Grid (
+                columns: 2,
+                gap: "2rem"
+            ) components: {
+                ui: Panel components: {
+                    ui: Form components: {
+                        ui: Input (
+                            label: "Username"
+                        ) description: {
+                            "Username input"
+                        }
+                        ui: Input (
+                            label: "Password",
+                            type: "password"
+                        ) description: {
+                            "Password input"
+                        }
                     }
-                    ui: Select (
-                        options: ["Option 1", "Option 2"]
+                }
+
+                ui: Panel components: {
+                    ui: Chart (
+                        type: "bar",
+                        data: "chartData"
                     ) description: {
-                        "Select dropdown"
+                        "User statistics"
                     }
                 }
             }
         }
-        """
-        tree = enhanced_ui_parser.parse(dsl)
-
-        # Navigate to Form UI definition
-        context = tree.children[0]
-        entity = context.children[1].children[0]
-        form_ui = entity.children[1].children[0]
-
-        # Verify Form component
-        assert form_ui.data == "ui_definition"
-        assert form_ui.children[0] == Token("BASIC_COMPONENT", "Form")
-
-        # Verify Input component
-        input_ui = form_ui.children[1].children[0]
-        assert input_ui.data == "ui_definition"
-        assert input_ui.children[0] == Token("INPUT_COMPONENT", "Input")
-
-        # Verify Select component
-        select_ui = form_ui.children[1].children[1]
-        assert select_ui.data == "ui_definition"
-        assert select_ui.children[0] == Token("INPUT_COMPONENT", "Select")
-
-    def test_complex_nested_layout(self, enhanced_ui_parser):
-        """Test a complex nested layout with multiple component types."""
-        dsl = """
-        @Context {
-            #Entity {
-                ui: Container (
-                    layout: {
-                        maxWidth: "1200px"
-                        margin: "0 auto"
-                    }
-                ) components: {
-                    ui: Grid (
-                        columns: 2,
-                        gap: "2rem"
-                    ) components: {
-                        ui: Panel components: {
-                            ui: Form components: {
-                                ui: Input (
-                                    label: "Username"
-                                ) description: {
-                                    "Username input"
-                                }
-                                ui: Input (
-                                    label: "Password",
-                                    type: "password"
-                                ) description: {
-                                    "Password input"
-                                }
-                            }
+    }
+}
+"""
+
+_EXPECTED_COMPLEX = {
+    "component": ("LAYOUT_COMPONENT", "Container"),
+    "params": {"layout": {"maxWidth": '"1200px"', "margin": '"0 auto"'}},
+    "children": [
+        {
+            "component": ("LAYOUT_COMPONENT", "Grid"),
+            "params": {"columns": "2", "gap": '"2rem"'},
+            "children": [
+                {
+                    "component": ("LAYOUT_COMPONENT", "Panel"),
+                    "children": [
+                        {
+                            "component": ("BASIC_COMPONENT", "Form"),
+                            "children": [
+                                {
+                                    "component": ("INPUT_COMPONENT", "Input"),
+                                    "params": {"label": '"Username"'},
+                                    "description": '"Username input"',
+                                },
+                                {
+                                    "component": ("INPUT_COMPONENT", "Input"),
+                                    "params": {
+                                        "label": '"Password"',
+                                        "type": '"password"',
+                                    },
+                                    "description": '"Password input"',
+                                },
+                            ],
                         }
-
-                        ui: Panel components: {
-                            ui: Chart (
-                                type: "bar",
-                                data: "chartData"
-                            ) description: {
-                                "User statistics"
-                            }
+                    ],
+                },
+                {
+                    "component": ("LAYOUT_COMPONENT", "Panel"),
+                    "children": [
+                        {
+                            "component": ("DISPLAY_COMPONENT", "Chart"),
+                            "params": {"type": '"bar"', "data": '"chartData"'},
+                            "description": '"User statistics"',
                         }
-                    }
-                }
-            }
+                    ],
+                },
+            ],
         }
-        """
-        tree = enhanced_ui_parser.parse(dsl)
-
-        # Navigate to Container
-        context = tree.children[0]
-        entity = context.children[1].children[0]
-        container_ui = entity.children[1].children[0]
-
-        # Verify Container component
-        assert container_ui.data == "ui_definition"
-        assert container_ui.children[0] == Token("LAYOUT_COMPONENT", "Container")
-
-        # Check layout params
-        layout_params = container_ui.children[1].children[0]
-        assert layout_params.data == "mixed_parameter_list"  # Updated assertion
-
-        # Navigate to Grid
-        grid_ui = container_ui.children[2].children[0]
-        assert grid_ui.data == "ui_definition"
-        assert grid_ui.children[0] == Token("LAYOUT_COMPONENT", "Grid")
-
-        # Navigate to Panels
-        left_panel = grid_ui.children[2].children[0]
-        assert left_panel.data == "ui_definition"
-        assert left_panel.children[0] == Token("LAYOUT_COMPONENT", "Panel")
-
-        right_panel = grid_ui.children[2].children[1]
-        assert right_panel.data == "ui_definition"
-        assert right_panel.children[0] == Token("LAYOUT_COMPONENT", "Panel")
-
-        # Check Form in left panel
-        form_ui = left_panel.children[1].children[0]
-        assert form_ui.data == "ui_definition"
-        assert form_ui.children[0] == Token("BASIC_COMPONENT", "Form")
+    ],
+}
+
+# (id, DSL, expected projection of the entity's UI definition)
+CASES = [
+    ("basic_component_with_description", _DSL_BASIC, _EXPECTED_BASIC),
+    ("nested_components", _DSL_NESTED, _EXPECTED_NESTED),
+    ("layout_parameters", _DSL_LAYOUT, _EXPECTED_LAYOUT),
+    ("navigation_components", _DSL_NAVIGATION, _EXPECTED_NAVIGATION),
+    ("input_components", _DSL_INPUT, _EXPECTED_INPUT),
+    ("complex_nested_layout", _DSL_COMPLEX, _EXPECTED_COMPLEX),
+]
+
+
+@pytest.fixture(scope="session")
+def grammar_text() -> str:
+    """Grammar source shared by the session's parsers."""
+    return _grammar()
+
+
+@pytest.fixture(scope="session")
+def enhanced_ui_parser(grammar_text, request):
+    """Fixture providing a parser with enhanced UI component support.
+
+    Parsers keep no state between parse() calls, so one instance serves the
+    whole session, for both the ``start`` and ``ui_component`` entry points.
+    The analyzed LALR tables are cached under pytest's cache directory; Lark
+    rebuilds them whenever the grammar changes. UI definitions are projected
+    by :class:`UIExtractor` while parsing.
+    """
+    cache = True
+    pytest_cache = getattr(request.config, "cache", None)
+    if pytest_cache is not None:
+        cache = str(pytest_cache.mkdir("lark") / "enhanced_ui_grammar.lark")
+    return Lark(
+        grammar_text,
+        parser="lalr",
+        start=["start", "ui_component"],
+        cache=cache,
+        transformer=UIExtractor(),
+    )
 
-        # Check Chart in right panel
-        chart_ui = right_panel.children[1].children[0]
-        assert chart_ui.data == "ui_definition"
-        assert chart_ui.children[0] == Token("DISPLAY_COMPONENT", "Chart")
 
+@pytest.fixture(scope="session")
+def parsed_trees(enhanced_ui_parser) -> Dict[str, Tree]:
+    """Parse every case DSL once; the tests only inspect the trees."""
+    return {
+        name: enhanced_ui_parser.parse(dsl, start="start") for name, dsl, _ in CASES
+    }
 
-import pytest
-from lark import Lark
-from pathlib import Path
-import os
 
+class TestEnhancedUIGrammar:
+    """Test suite for enhanced UI component grammar features."""
 
-@pytest.fixture
-def grammar():
-    """Load the grammar file for testing."""
-    current_dir = Path(os.path.dirname(os.path.abspath(__file__)))
-    grammar_path = current_dir / "../../domainforge/core/grammar.lark"
+    @pytest.mark.parametrize(
+        "name, expected",
+        [(name, expected) for name, _, expected in CASES],
+        ids=[case[0] for case in CASES],
+    )
+    def test_parse_shape(
+        self,
+        parsed_trees: Dict[str, Tree],
+        name: str,
+        expected: Dict[str, Any],
+    ) -> None:
+        """Test the entity's UI definition parses to the expected shape."""
+        tree = parsed_trees[name]
 
-    with open(grammar_path, "r") as f:
-        return f.read()
+        # Verify context and entity structure
+        context = tree.children[0]
+        assert _tok(context.children[0]) == ("IDENTIFIER", "Context")
 
+        entity = context.children[1].children[0]
+        assert _tok(entity.children[0]) == ("IDENTIFIER", "Entity")
 
-@pytest.fixture
-def ui_parser(grammar):
-    """Create a parser for UI component testing."""
-    return Lark(grammar, start="ui_component")
+        ui_def = entity.children[1].children[0]
+        assert isinstance(ui_def, UIDefinition)
+        assert _project(ui_def) == expected
 
 
-def test_BasicComponent_WithProperties_ParsesSuccessfully(ui_parser):
+def test_BasicComponent_WithProperties_ParsesSuccessfully(enhanced_ui_parser):
     """Test that a basic component with properties can be parsed."""
     # Arrange
     input_text = """
@@ -366,14 +445,14 @@ def test_BasicComponent_WithProperties_ParsesSuccessfully(ui_parser):
     """
 
     # Act
-    result = ui_parser.parse(input_text)
+    result = enhanced_ui_parser.parse(input_text, start="ui_component")
 
     # Assert
     assert result is not None
     assert result.data == "ui_component"
 
 
-def test_NestedComponents_WithChildren_ParsesSuccessfully(ui_parser):
+def test_NestedComponents_WithChildren_ParsesSuccessfully(enhanced_ui_parser):
     """Test that nested components with children can be parsed."""
     # Arrange
     input_text = """
@@ -397,14 +476,14 @@ def test_NestedComponents_WithChildren_ParsesSuccessfully(ui_parser):
     """
 
     # Act
-    result = ui_parser.parse(input_text)
+    result = enhanced_ui_parser.parse(input_text, start="ui_component")
 
     # Assert
     assert result is not None
     assert result.data == "ui_component"
 
 
-def test_ComponentWithLayout_ParsesSuccessfully(ui_parser):
+def test_ComponentWithLayout_ParsesSuccessfully(enhanced_ui_parser):
     """Test that a component with layout specification can be parsed."""
     # Arrange
     input_text = """
@@ -422,14 +501,14 @@ def test_ComponentWithLayout_ParsesSuccessfully(ui_parser):
     """
 
     # Act
-    result = ui_parser.parse(input_text)
+    result = enhanced_ui_parser.parse(input_text, start="ui_component")
 
     # Assert
     assert result is not None
     assert result.data == "ui_component"
 
 
-def test_NavigationFlow_BasicSyntax_ParsesSuccessfully(ui_parser):
+def test_NavigationFlow_BasicSyntax_ParsesSuccessfully(enhanced_ui_parser):
     """Test that a component with navigation flow can be parsed."""
     # Arrange
     input_text = """
@@ -444,14 +523,14 @@ def test_NavigationFlow_BasicSyntax_ParsesSuccessfully(ui_parser):
     """
 
     # Act
-    result = ui_parser.parse(input_text)
+    result = enhanced_ui_parser.parse(input_text, start="ui_component")
 
     # Assert
     assert result is not None
     assert result.data == "ui_component"
 
 
-def test_ComplexComponent_WithAllFeatures_ParsesSuccessfully(ui_parser):
+def test_ComplexComponent_WithAllFeatures_ParsesSuccessfully(enhanced_ui_parser):
     """Test that a complex component with all features can be parsed."""
     # Arrange
     input_text = """
@@ -502,7 +581,7 @@ def test_ComplexComponent_WithAllFeatures_ParsesSuccessfully(ui_parser):
     """
 
     # Act
-    result = ui_parser.parse(input_text)
+    result = enhanced_ui_parser.parse(input_text, start="ui_component")
 
     # Assert
     assert result is not None
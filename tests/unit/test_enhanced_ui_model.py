@@ -1,6 +1,7 @@
 import pytest
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Union, Any
+from typing import Dict, List, Optional, Tuple, Union, Any
 from enum import Enum
 
 
@@ -49,6 +50,10 @@ class ComponentType(Enum):
     PROGRESS = "Progress"
 
 
+# Component name -> enum member, built once instead of per ComponentType() call
+_COMPONENT_TYPE_BY_VALUE = {ct.value: ct for ct in ComponentType}
+
+
 @dataclass
 class UIComponent:
     """Base class for UI components in the domain model."""
@@ -73,61 +78,78 @@ class MockTransformer:
 
     def transform_component_type(self, component_name: str) -> ComponentType:
         """Transform component name string into ComponentType enum."""
-        return ComponentType(component_name)
+        try:
+            return _COMPONENT_TYPE_BY_VALUE[component_name]
+        except KeyError:
+            # Unknown names still raise the enum's own ValueError
+            return ComponentType(component_name)
 
     def transform_ui_definition(self, ui_def_tree) -> UIDefinition:
-        """Transform UI definition tree into UIDefinition domain model."""
-        # Simple example transformation - would be more complex in real implementation
-        component_name = ui_def_tree.children[0].value
-        component_type = self.transform_component_type(component_name)
-
-        component = UIComponent(component_type=component_type)
-
-        # Process parameters if present
-        if (
-            len(ui_def_tree.children) > 1
-            and ui_def_tree.children[1].data == "ui_params"
-        ):
-            params_tree = ui_def_tree.children[1]
-            component.parameters = self._extract_parameters(params_tree)
-
-            # Process layout params if present
-            for child in params_tree.children:
-                if hasattr(child, "data") and child.data == "layout_params":
-                    component.layout = self._extract_layout(child)
-
-        # Process children if present
-        children_index = -1
-        for i, child in enumerate(ui_def_tree.children):
-            if hasattr(child, "data") and child.data == "ui_children":
-                children_index = i
-                break
-
-        if children_index >= 0:
-            children_tree = ui_def_tree.children[children_index]
-            for child_tree in children_tree.children:
-                child_component = self.transform_ui_definition(child_tree)
-                component.children.append(child_component.component)
-
-        # Process description if present
-        desc_index = -1
-        for i, child in enumerate(ui_def_tree.children):
-            if hasattr(child, "data") and child.data == "ui_desc":
-                desc_index = i
-                break
-
-        if desc_index >= 0:
-            desc_tree = ui_def_tree.children[desc_index]
-            if (
-                desc_tree.children
-                and hasattr(desc_tree.children[0], "data")
-                and desc_tree.children[0].data == "description"
-            ):
-                component.description = (
-                    desc_tree.children[0].children[0].value.strip('"')
-                )
-
-        return UIDefinition(component=component)
+        """Transform UI definition tree into UIDefinition domain model.
+
+        Nested definitions are walked with an explicit stack instead of
+        recursion, so deep hierarchies cost no Python frames per level.
+        """
+        root = None
+        # (ui_definition tree, children list of its parent component)
+        stack = deque([(ui_def_tree, None)])
+        while stack:
+            tree, parent_children = stack.pop()
+
+            # Simple example transformation - would be more complex in a
+            # real implementation
+            component_name = tree.children[0].value
+            component_type = self.transform_component_type(component_name)
+
+            component = UIComponent(component_type=component_type)
+            if parent_children is None:
+                root = component
+            else:
+                parent_children.append(component)
+
+            params_tree, children_tree, desc_tree = self._classify_parts(tree)
+
+            # Process parameters if present
+            if params_tree is not None:
+                component.parameters = self._extract_parameters(params_tree)
+
+                # Process layout params if present
+                for child in params_tree.children:
+                    if getattr(child, "data", None) == "layout_params":
+                        component.layout = self._extract_layout(child)
+
+            # Process children if present; pushed in reverse so they are
+            # popped, and appended, in order
+            if children_tree is not None:
+                for child_tree in reversed(children_tree.children):
+                    stack.append((child_tree, component.children))
+
+            # Process description if present
+            if desc_tree is not None:
+                component.description = self._extract_description(desc_tree)
+
+        return UIDefinition(component=root)
+
+    def _classify_parts(self, ui_def_tree) -> Tuple[Any, Any, Any]:
+        """Find the params, children and description parts in one pass."""
+        params_tree = children_tree = desc_tree = None
+        for child in ui_def_tree.children[1:]:
+            data = getattr(child, "data", None)
+            if data == "ui_params":
+                params_tree = child
+            elif data == "ui_children":
+                children_tree = child
+            elif data == "ui_desc":
+                desc_tree = child
+        return params_tree, children_tree, desc_tree
+
+    def _extract_description(self, desc_tree) -> Optional[str]:
+        """Extract the unquoted description text from a description tree."""
+        if desc_tree.children:
+            description = desc_tree.children[0]
+            if getattr(description, "data", None) == "description":
+                return description.children[0].value.strip('"')
+        return None
 
     def _extract_parameters(self, params_tree) -> Dict[str, Any]:
         """Extract parameters from parameter list tree."""
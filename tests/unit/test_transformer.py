@@ -1,15 +1,8 @@
-import pytest
 from lark import Token, Tree
 
 from domainforge.core.models import (
     DomainModel,
 )
-from domainforge.core.transformer import DomainForgeTransformer
-
-
-@pytest.fixture
-def transformer():
-    return DomainForgeTransformer()
 
 
 def test_transform_simple_entity(transformer):